@@ -1,5 +1,5 @@
 """
-ackDeleteRedundant 1.1
+ackDeleteRedundant 1.2
 12/04/07
 Aaron Koressel
 23 Aug 2016 - Converted to Python by Jeffrey "italic" Hoover
@@ -8,17 +8,44 @@ Deletes keys that have the same value as its two
 neighboring keys.  Will only delete keys that are
 in the current selection.
 
+With evaluate=True, deletes keys that lie on the
+curve their neighbors already define instead, such
+as keys on linear ramps and smooth spline segments.
+The curve is evaluated with ita_CurveEval, without
+and with each key, and keys are deleted when the
+difference stays within tolerance.
+
 SYNTAX:
 mel:
 ackDeleteRedundant;
 python:
 import ackDeleteRedundant
 ackDeleteRedundant.ackDeleteRedundant()
+ackDeleteRedundant.ackDeleteRedundant(evaluate=True)
+
+Scene-wide or namespace-wide, without a selection.
+Prints a report of keys per curve; nothing is deleted
+until dryRun=False. Curves are analyzed in worker
+processes and deleted in one undo chunk:
+ackDeleteRedundant.ackDeleteRedundantScene()
+ackDeleteRedundant.ackDeleteRedundantScene(namespace="char1", dryRun=False)
+
+Curves where every key is redundant are replaced by
+their constant value, removing the animCurve node:
+ackDeleteRedundant.deleteStaticCurves()
+ackDeleteRedundant.deleteStaticCurves(namespace="char1", dryRun=False)
 
 EXAMPLE:
 Assign this commnad to Ctrl-Alt-R:  ackDeleteRedundant;
 
 CHANGELOG:
+1.2 - 18 Oct 2026
+Query each curve once and find redundant keys with NumPy
+Delete each curve's keys with a single cutKey
+Tangent-aware pruning with evaluate=True
+Scene-wide cleanup with a dry-run report
+Static curve elimination
+Throttled progress window, cancellable scene cleanup
 1.1 - 12/04/07
 Uses a tolerance value for checking redundancy
 1.0 - 2/9/07
@@ -26,90 +53,376 @@ First version
 """
 
 import maya.cmds as cmds
+import maya.mel as mel
 import maya.OpenMaya as om
+import maya.OpenMayaAnim as oma
+import multiprocessing
+import numpy
+import os
 import sys
 
+import ita_CurveEval
+from ita_Progress import Progress
+from ackDeleteRedundantCore import analyzeCurve, timeRanges, staticCurveMask
 
-def ackDeleteRedundant():
-    tolerance = 0.00001
-    sc = cmds.keyframe(q=True, sl=True, name=True)
+# Time-based curves; curves driven by other attributes are left alone
+ANIM_CURVE_TYPES = ["animCurveTL", "animCurveTA", "animCurveTT", "animCurveTU"]
+
+
+def curveData(c, tangents=False):
+    """
+    Query a curve's keys and tangents, one query per attribute.
+
+    :param c: Name of an animCurve.
+    :param tangents: Also query tangents, for evaluate mode.
+    :return: (times, values, inSlopes, outSlopes, inTypes, outTypes, weighted)
+             Tangent entries are None unless tangents is set.
+    """
+    times = cmds.keyframe(c, q=True, tc=True)
+    values = cmds.keyframe(c, q=True, vc=True)
+    if not tangents:
+        return times, values, None, None, None, None, None
+
+    fps = mel.eval("currentTimeUnitToFPS")
+    return (
+        times,
+        values,
+        ita_CurveEval.slopes_from_angles(cmds.keyTangent(c, q=True, ia=True), fps),
+        ita_CurveEval.slopes_from_angles(cmds.keyTangent(c, q=True, oa=True), fps),
+        cmds.keyTangent(c, q=True, itt=True),
+        cmds.keyTangent(c, q=True, ott=True),
+        cmds.keyTangent(c, q=True, wt=True)[0],
+    )
+
+
+def sameData(a, b):
+    """
+    Test if two curveData results are identical, key for key.
+
+    :param a: curveData result.
+    :param b: curveData result.
+    """
+    for x, y in zip(a, b):
+        if x is None or y is None:
+            if x is not y:
+                return False
+        elif not numpy.array_equal(numpy.asarray(x), numpy.asarray(y)):
+            return False
+    return True
+
+
+def mayapyPath():
+    """
+    Path of the mayapy interpreter of the running Maya.
+
+    :return: Path, or None if it cannot be found.
+    """
+    name = "mayapy.exe" if sys.platform == "win32" else "mayapy"
+    path = os.path.join(os.environ.get("MAYA_LOCATION", ""), "bin", name)
+    return path if os.path.isfile(path) else None
+
+
+def analyzeCurves(jobs, processes=None):
+    """
+    Run analyzeCurve over many curves in worker processes.
 
-    # estimate time
+    analyzeCurve lives in ackDeleteRedundantCore, so workers import neither
+    this module nor Maya.
+
+    :param jobs: List of analyzeCurve jobs.
+    :param processes: Number of worker processes. Defaults to CPU count; 1 runs in Maya's process.
+    :return: Dict of curve name to analyzeCurve result.
+    """
+    if processes == 1 or len(jobs) < 2:
+        return dict(analyzeCurve(job) for job in jobs)
+
+    if hasattr(multiprocessing, "get_start_method"):
+        method = multiprocessing.get_start_method()
+    else:
+        method = "spawn" if sys.platform == "win32" else "fork"
+    if method != "fork":
+        # Spawned workers run sys.executable, which is the Maya GUI; they must run mayapy
+        executable = mayapyPath()
+        if executable is None:
+            om.MGlobal.displayWarning("mayapy not found, analyzing in Maya's process")
+            return dict(analyzeCurve(job) for job in jobs)
+        multiprocessing.set_executable(executable)
+    pool = multiprocessing.Pool(processes=processes)
     try:
-        mx = len(sc)
-    except TypeError:
+        return dict(pool.map(analyzeCurve, jobs, chunksize=max(1, len(jobs) // 64)))
+    finally:
+        pool.close()
+        pool.join()
+
+
+def freezeTangents(c, delIndices, inTypes, outTypes):
+    """
+    Fix tangents Maya would recompute around deleted keys.
+
+    Spline, clamped, plateau and auto tangents of the remaining neighbors
+    are set to fixed, which keeps their current angles.
+
+    :param c: Name of an animCurve.
+    :param delIndices: Sorted Numpy array of key indices about to be deleted.
+    :param inTypes: In tangent type of each key.
+    :param outTypes: Out tangent type of each key.
+    """
+    neighbors = numpy.setdiff1d(
+        numpy.union1d(delIndices - 1, delIndices + 1), delIndices)
+    neighbors = neighbors[(neighbors >= 0) & (neighbors < len(inTypes))]
+
+    for flag, types in (("itt", inTypes), ("ott", outTypes)):
+        indices = [
+            (int(i), int(i)) for i in neighbors
+            if types[i] in ita_CurveEval.AUTO_TANGENTS
+        ]
+        if indices:
+            cmds.keyTangent(c, e=True, index=indices, **{flag: "fixed"})
+
+
+def deleteKeys(c, delIndices, data, evaluate):
+    """
+    Delete keys of one curve with a single cutKey.
+
+    :param c: Name of an animCurve.
+    :param delIndices: Sorted Numpy array of key indices.
+    :param data: curveData result the indices were found in.
+    :param evaluate: Indices came from evaluate mode; fix neighboring tangents first.
+    """
+    if not len(delIndices):
+        return
+    times, _, _, _, inTypes, outTypes, _ = data
+    if evaluate:
+        freezeTangents(c, delIndices, inTypes, outTypes)
+    cmds.cutKey(c, time=timeRanges(delIndices, times), clear=True)
+
+
+def ackDeleteRedundant(tolerance=0.00001, evaluate=False):
+    """
+    Delete redundant selected keys.
+
+    :param tolerance: Largest difference treated as equal.
+    :param evaluate: Delete keys that lie on the curve defined by their neighbors.
+    """
+    sc = cmds.keyframe(q=True, sl=True, name=True)
+
+    if not sc:
         om.MGlobal.displayWarning("Select keys to continue")
-        sys.exit()
-    for ch in sc:
-        mx += cmds.keyframe(ch, q=True, kc=True)
-
-    # progess window
-    cmds.progressWindow(
-        title='ackDeleteRedundant',
-        max=mx,
-        status='Deleting redundant keys...',
-        ii=True
-    )
+        return
 
-    # only run if at least one key is selected
-    keyCount = cmds.keyframe(q=True, kc=True)
-    if keyCount != 0:
+    with Progress("ackDeleteRedundant", len(sc), status="Deleting redundant keys...") as progress:
         # loop over selected curves and process independently
         for c in sc:
-            # progress update
-            if cmds.progressWindow(q=True, ic=True):
+            if progress.step():
                 break
-            cmds.progressWindow(e=True, step=1)
 
-            # get values for current channel as array
-            valueArray = cmds.keyframe(c, q=True, vc=True)
+            # keys, but only those that were selected
+            selArray = numpy.asarray(
+                cmds.keyframe(c, q=True, sl=True, iv=True) or [], dtype=int)
+            data = curveData(c, tangents=evaluate)
 
-            inSeries = False
-            first = False
-            delArray = []
+            _, delIndices = analyzeCurve((c, data, selArray, tolerance, evaluate))
+            if delIndices is None:
+                om.MGlobal.displayWarning("Skipping weighted curve {}".format(c))
+                continue
 
-            # search for redundant keys
-            for i, v in enumerate(valueArray):
-                # progress update
-                if cmds.progressWindow(q=True, ic=True):
-                    break
-                cmds.progressWindow(e=True, step=1)
-
-                if i < len(valueArray) - 1:
-                    delta = v - valueArray[i + 1]
-
-                    if abs(delta) <= tolerance:
-                        if first is False and inSeries is False:
-                            first = True
-                            inSeries = True
-
-                        else:
-                            # add to array of keys to delete
-                            keyTime = cmds.keyframe(c, q=True, index=(i,), tc=True)
-                            delArray.append(keyTime[0])
-
-                    else:
-                        # this value not the same as next to start series over
-                        first = False
-                        inSeries = False
-
-            # delete the redundant keys but only those that were selected
-            selArray = cmds.keyframe(c, q=True, tc=True)
-            for i, v in enumerate(delArray):
-                # progress update
-                if cmds.progressWindow(q=True, ic=True):
+            # remove keys with one edit per curve
+            deleteKeys(c, delIndices, data, evaluate)
+
+
+def sceneCurves(namespace=None):
+    """
+    List time-based animCurves of the scene, or of a namespace and all its nested namespaces.
+
+    :param namespace: Namespace name, without trailing colon.
+    :return: List of animCurve names.
+    """
+    if namespace:
+        return cmds.ls(namespacePatterns(namespace), type=ANIM_CURVE_TYPES) or []
+    return cmds.ls(type=ANIM_CURVE_TYPES) or []
+
+
+def namespacePatterns(namespace):
+    """
+    ls patterns of all nodes in a namespace and its nested namespaces, at any depth.
+
+    :param namespace: Namespace name, without trailing colon.
+    :return: List of patterns, empty if the namespace does not exist.
+    """
+    namespace = ":" + namespace.strip(":")
+    if not cmds.namespace(exists=namespace):
+        return []
+    children = cmds.namespaceInfo(
+        namespace, listOnlyNamespaces=True, recurse=True, absoluteName=True) or []
+    return [ns + ":*" for ns in [namespace] + children]
+
+
+def printReport(report):
+    """
+    Print keys to delete per curve and the total savings.
+
+    :param report: ackDeleteRedundantScene report.
+    """
+    rows = sorted(
+        ((len(d), len(data[0]), c) for c, (d, data, _) in report.items() if d is not None and len(d)),
+        reverse=True)
+    for count, total, c in rows:
+        print("{:>8} of {:>8} keys  {}".format(count, total, c))
+
+    deleted = sum(row[0] for row in rows)
+    keys = sum(len(data[0]) for d, data, _ in report.values())
+    skipped = sum(1 for d, _, _ in report.values() if d is None)
+    print("Total: {} of {} keys ({:.1f}%) on {} of {} curves".format(
+        deleted, keys, 100.0 * deleted / max(keys, 1), len(rows), len(report)))
+    if skipped:
+        print("Skipped {} weighted curves".format(skipped))
+
+
+def ackDeleteRedundantScene(namespace=None, tolerance=0.00001, evaluate=False,
+                            dryRun=True, processes=None):
+    """
+    Delete redundant keys on every animCurve of the scene or a namespace.
+
+    Curves are analyzed in worker processes. A report of keys per curve is
+    printed; keys are only deleted when dryRun is False, in one undo chunk.
+
+    :param namespace: Limit to curves in this namespace and its children.
+    :param tolerance: Largest difference treated as equal.
+    :param evaluate: Delete keys that lie on the curve defined by their neighbors.
+    :param dryRun: Only report, do not delete.
+    :param processes: Number of worker processes. Defaults to CPU count.
+    :return: Report dict of curve name to (key indices or None if skipped, curveData, evaluate).
+        None if cancelled while querying curves.
+    """
+    curves = sceneCurves(namespace)
+    data = {}
+    with Progress("ackDeleteRedundantScene", len(curves), status="Querying curves...") as progress:
+        for c in curves:
+            if progress.step():
+                om.MGlobal.displayWarning("Cancelled, nothing deleted")
+                return None
+            data[c] = curveData(c, tangents=evaluate)
+    jobs = [(c, data[c], None, tolerance, evaluate) for c in curves]
+
+    results = analyzeCurves(jobs, processes=processes)
+    report = dict((c, (results[c], data[c], evaluate)) for c in curves)
+    printReport(report)
+
+    if not dryRun:
+        applyReport(report)
+    return report
+
+
+def applyReport(report):
+    """
+    Delete the keys found by ackDeleteRedundantScene in one undo chunk.
+
+    Curves whose keys or tangents changed in any way since the report are
+    skipped. Cancelling keeps the curves done so far, which still undo in
+    one step.
+
+    :param report: ackDeleteRedundantScene report.
+    """
+    cmds.undoInfo(openChunk=True)
+    try:
+        with Progress("ackDeleteRedundantScene", len(report), status="Deleting keys...") as progress:
+            for c, (delIndices, data, evaluate) in report.items():
+                if progress.step():
                     break
+                if delIndices is None or not len(delIndices):
+                    continue
+                if not cmds.objExists(c) or not sameData(curveData(c, tangents=evaluate), data):
+                    om.MGlobal.displayWarning("Keys changed since the report, skipping {}".format(c))
+                    continue
+                deleteKeys(c, delIndices, data, evaluate)
+    finally:
+        cmds.undoInfo(closeChunk=True)
+
+
+def keyCounts(curves):
+    """
+    Number of keys of each curve, read through the API instead of a query per curve.
+
+    :param curves: animCurve names.
+    :return: List of key counts, in curve order.
+    """
+    sel = om.MSelectionList()
+    for c in curves:
+        sel.add(c)
+    fn = oma.MFnAnimCurve()
+    counts = []
+    for i in range(sel.length()):
+        node = om.MObject()
+        sel.getDependNode(i, node)
+        fn.setObject(node)
+        counts.append(fn.numKeys())
+    return counts
+
 
-                # see if this key is in the selection
-                for j, w in enumerate(selArray):
-                    # progress update
-                    if cmds.progressWindow(q=True, ic=True):
-                        break
+def deleteStaticCurves(namespace=None, tolerance=0.00001, dryRun=True):
+    """
+    Replace flat animCurves with the constant value they hold.
 
-                    if selArray[j] == delArray[i]:
-                        # remove key
-                        cmds.cutKey(c, time=(delArray[i], delArray[i]), clear=True)
-                        break
+    Each flat curve is disconnected and deleted, and the attributes it drove
+    are set to its value. Referenced curves and curves that drive nothing or
+    locked attributes are left alone.
+
+    :param namespace: Limit to curves in this namespace and its children.
+    :param tolerance: Largest difference treated as equal.
+    :param dryRun: Only report, do not delete.
+    :return: List of static curve names found.
+    """
+    curves = sceneCurves(namespace)
+    referenced = set(cmds.ls(curves, referencedNodes=True) or []) if curves else set()
+    curves = [c for c in curves if c not in referenced]
+    counts = keyCounts(curves)
+    curves = [c for c, n in zip(curves, counts) if n]
+    counts = [n for n in counts if n]
+    if not curves:
+        print("Found 0 static curves")
+        return []
+
+    # One query per attribute for all curves, concatenated in curve order
+    def gather(query, **flags):
+        result = query(curves, q=True, **flags) or []
+        if len(result) != sum(counts):
+            raise RuntimeError("Unexpected number of keys from {}".format(flags))
+        return result
+
+    mask = staticCurveMask(
+        counts,
+        gather(cmds.keyframe, vc=True),
+        gather(cmds.keyTangent, ia=True),
+        gather(cmds.keyTangent, oa=True),
+        gather(cmds.keyTangent, itt=True),
+        gather(cmds.keyTangent, ott=True),
+        tolerance,
+    )
+
+    static = []
+    for c in numpy.asarray(curves)[mask]:
+        plugs = cmds.listConnections(c + ".output", s=False, d=True, plugs=True) or []
+        if plugs and not any(cmds.getAttr(plug, lock=True) for plug in plugs):
+            static.append((str(c), plugs))
+
+    print("Found {} static curves of {}".format(len(static), len(curves)))
+    if dryRun:
+        for c, plugs in static:
+            print("    {} -> {}".format(c, ", ".join(plugs)))
+        return [c for c, _ in static]
+
+    cmds.undoInfo(openChunk=True)
+    try:
+        for c, plugs in static:
+            # Destination value is already in the attribute's own units
+            constants = [cmds.getAttr(plug) for plug in plugs]
+            for plug, value in zip(plugs, constants):
+                cmds.disconnectAttr(c + ".output", plug)
+                cmds.setAttr(plug, value)
+        if static:
+            cmds.delete([c for c, _ in static])
+    finally:
+        cmds.undoInfo(closeChunk=True)
 
-    # kill window
-    cmds.progressWindow(endProgress=True)
+    print("Removed {} animCurve nodes".format(len(static)))
+    return [c for c, _ in static]
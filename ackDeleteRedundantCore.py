@@ -0,0 +1,199 @@
+"""
+ackDeleteRedundantCore
+Key analysis for ackDeleteRedundant.
+
+Pure NumPy on queried curve data, without Maya, pymel or Qt imports, so
+worker processes of ackDeleteRedundant.analyzeCurves can import it
+without starting Maya. See ackDeleteRedundant for usage.
+"""
+
+import numpy
+
+import ita_CurveEval
+
+
+def redundantIndices(values, tolerance):
+    """
+    Find keys that have the same value as both of their neighbors.
+
+    The first and last key of each run of equal values are kept.
+
+    :param values: Key values of a curve, in key order.
+    :param tolerance: Largest difference between neighboring values treated as equal.
+    :return: Numpy array of redundant key indices.
+    """
+    values = numpy.asarray(values, dtype=float)
+    if values.size < 3:
+        return numpy.empty(0, dtype=int)
+    same = numpy.abs(numpy.diff(values)) <= tolerance
+    return numpy.flatnonzero(same[:-1] & same[1:]) + 1
+
+
+def prunableIndices(times, values, inSlopes, outSlopes, inTypes, outTypes,
+                    tolerance, candidates=None, samples=4):
+    """
+    Find keys that can be deleted without changing the curve.
+
+    Keys are deleted in alternating passes of non-neighboring keys, so the
+    segments bridging over them never overlap. Every bridge is checked
+    against the original curve, so the error never builds up past tolerance.
+    Tangents of the remaining keys are assumed to stay as they are, except
+    linear and flat tangents, which follow their new neighbors.
+
+    :param times: Key times, ascending.
+    :param values: Key values.
+    :param inSlopes: In slope of each key, per time unit.
+    :param outSlopes: Out slope of each key, per time unit.
+    :param inTypes: In tangent type of each key.
+    :param outTypes: Out tangent type of each key.
+    :param tolerance: Largest difference from the original curve.
+    :param candidates: Indices of keys allowed to be deleted. Defaults to all keys.
+    :param samples: Samples taken inside each original segment.
+    :return: Numpy array of deletable key indices.
+    """
+    times = numpy.asarray(times, dtype=float)
+    values = numpy.asarray(values, dtype=float)
+    inSlopes = numpy.asarray(inSlopes, dtype=float)
+    outSlopes = numpy.asarray(outSlopes, dtype=float)
+    inTypes = ita_CurveEval.tangent_codes(inTypes)
+    outTypes = ita_CurveEval.tangent_codes(outTypes)
+    n = times.size
+    if n < 3:
+        return numpy.empty(0, dtype=int)
+
+    allowed = numpy.zeros(n, dtype=bool)
+    if candidates is None:
+        allowed[:] = True
+    else:
+        allowed[numpy.asarray(candidates, dtype=int)] = True
+
+    # Original curve sampled at every key and inside every segment;
+    # key i is grid sample i * step
+    step = samples + 1
+    fractions = numpy.arange(step) / float(step)
+    grid = (times[:-1, None] + numpy.diff(times)[:, None] * fractions).ravel()
+    grid = numpy.append(grid, times[-1])
+    reference = ita_CurveEval.evaluate(
+        times, values, inSlopes, outSlopes, outTypes, grid, in_types=inTypes)
+
+    keep = numpy.ones(n, dtype=bool)
+    # Neighbors of each key's last failed test; retesting them would fail again
+    failedPrev = numpy.full(n, -1, dtype=int)
+    failedNext = numpy.full(n, -1, dtype=int)
+    idle = 0
+    offset = 1
+    while idle < 2:
+        kept = numpy.flatnonzero(keep)
+        pos = numpy.arange(offset, kept.size - 1, 2)
+        offset = 2 if offset == 1 else 1
+
+        prev, cand, nxt = kept[pos - 1], kept[pos], kept[pos + 1]
+        test = allowed[cand] & ((failedPrev[cand] != prev) | (failedNext[cand] != nxt))
+        prev, cand, nxt = prev[test], cand[test], nxt[test]
+        if not cand.size:
+            idle += 1
+            continue
+
+        m0, m1 = ita_CurveEval.resolve_slopes(
+            times[prev], values[prev], times[nxt], values[nxt],
+            outTypes[prev], inTypes[nxt], outSlopes[prev], inSlopes[nxt])
+
+        # Grid samples covered by each bridge from prev to nxt
+        lengths = (nxt - prev) * step + 1
+        bridge = numpy.repeat(numpy.arange(cand.size), lengths)
+        sample = numpy.arange(lengths.sum()) + numpy.repeat(
+            prev * step - (numpy.cumsum(lengths) - lengths), lengths)
+        p, q = prev[bridge], nxt[bridge]
+
+        bridged = ita_CurveEval.evaluate_segments(
+            times[p], values[p], m0[bridge], times[q], values[q], m1[bridge],
+            outTypes[p], grid[sample])
+
+        error = numpy.zeros(cand.size)
+        numpy.maximum.at(error, bridge, numpy.abs(bridged - reference[sample]))
+
+        passed = error <= tolerance
+        keep[cand[passed]] = False
+        failedPrev[cand[~passed]] = prev[~passed]
+        failedNext[cand[~passed]] = nxt[~passed]
+        idle = 0 if passed.any() else idle + 1
+
+    return numpy.flatnonzero(~keep)
+
+
+def analyzeCurve(job):
+    """
+    Find the keys to delete on one curve.
+
+    Pure math on queried data, so it can run in a worker process.
+
+    :param job: Tuple of curve name, curveData result, candidate key
+                indices or None for all keys, tolerance, evaluate.
+    :return: (curve name, Numpy array of key indices or None if skipped)
+    """
+    c, data, candidates, tolerance, evaluate = job
+    times, values, inSlopes, outSlopes, inTypes, outTypes, weighted = data
+
+    if evaluate:
+        if weighted:
+            return c, None
+        delIndices = prunableIndices(
+            times, values, inSlopes, outSlopes, inTypes, outTypes,
+            tolerance, candidates=candidates)
+    else:
+        delIndices = redundantIndices(values, tolerance)
+        if candidates is not None:
+            delIndices = numpy.intersect1d(delIndices, candidates, assume_unique=True)
+
+    return c, delIndices
+
+
+def timeRanges(indices, times):
+    """
+    Merge key indices into time ranges of consecutive keys.
+
+    :param indices: Sorted Numpy array of key indices.
+    :param times: Key times of the curve, in key order.
+    :return: List of (start, end) time tuples, one per run of consecutive indices.
+    """
+    if not len(indices):
+        return []
+    times = numpy.asarray(times, dtype=float)
+    breaks = numpy.flatnonzero(numpy.diff(indices) != 1)
+    starts = indices[numpy.r_[0, breaks + 1]]
+    ends = indices[numpy.r_[breaks, len(indices) - 1]]
+    return list(zip(times[starts].tolist(), times[ends].tolist()))
+
+
+def staticCurveMask(counts, values, inAngles, outAngles, inTypes, outTypes, tolerance):
+    """
+    Find flat curves among many, in one pass over all their keys.
+
+    A curve is flat when its values differ by no more than tolerance and
+    no tangent leaves the flat line between keys or past the last key.
+
+    :param counts: Number of keys of each curve. All must be at least 1.
+    :param values: Key values of all curves, concatenated in curve order.
+    :param inAngles: In tangent angles of all keys.
+    :param outAngles: Out tangent angles of all keys.
+    :param inTypes: In tangent types of all keys.
+    :param outTypes: Out tangent types of all keys.
+    :param tolerance: Largest difference treated as equal.
+    :return: Numpy boolean array, True for each flat curve.
+    """
+    counts = numpy.asarray(counts, dtype=int)
+    values = numpy.asarray(values, dtype=float)
+    starts = numpy.cumsum(counts) - counts
+
+    spread = numpy.maximum.reduceat(values, starts) - numpy.minimum.reduceat(values, starts)
+
+    # Linear, flat and step tangents are level when the values are
+    sloped = (
+        (numpy.abs(numpy.asarray(inAngles, dtype=float)) > tolerance) &
+        (ita_CurveEval.tangent_codes(inTypes) == ita_CurveEval.FIXED)
+    ) | (
+        (numpy.abs(numpy.asarray(outAngles, dtype=float)) > tolerance) &
+        (ita_CurveEval.tangent_codes(outTypes) == ita_CurveEval.FIXED)
+    )
+
+    return (spread <= tolerance) & (numpy.add.reduceat(sloped.astype(int), starts) == 0)
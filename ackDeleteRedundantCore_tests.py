@@ -0,0 +1,162 @@
+"""
+Tests for ackDeleteRedundantCore.
+
+Runs without Maya. Every case checks that the curve left after deleting
+the found keys stays within tolerance of the original curve.
+"""
+
+import unittest
+import numpy
+import ita_CurveEval
+import ackDeleteRedundantCore as core
+
+
+def sample_grid(times, samples):
+    """Key times plus samples evenly spaced inside every segment."""
+    step = samples + 1
+    fractions = numpy.arange(step) / float(step)
+    grid = (times[:-1, None] + numpy.diff(times)[:, None] * fractions).ravel()
+    return numpy.append(grid, times[-1])
+
+
+def curve_error(times, values, in_slopes, out_slopes, in_types, out_types, deleted, samples=4):
+    """Largest difference between the curve and the curve without the deleted keys."""
+    times = numpy.asarray(times, dtype=float)
+    grid = sample_grid(times, samples)
+    original = ita_CurveEval.evaluate(
+        times, values, in_slopes, out_slopes, out_types, grid, in_types=in_types)
+
+    keep = numpy.ones(len(times), dtype=bool)
+    keep[deleted] = False
+    pruned = ita_CurveEval.evaluate(
+        times[keep], numpy.asarray(values)[keep],
+        numpy.asarray(in_slopes)[keep], numpy.asarray(out_slopes)[keep],
+        numpy.asarray(out_types)[keep], grid, in_types=numpy.asarray(in_types)[keep])
+    return numpy.abs(pruned - original).max()
+
+
+class TestPrunableIndices(unittest.TestCase):
+
+    def test_ramp(self):
+        """All inner keys of a linear ramp are deleted."""
+        times = numpy.arange(11.0)
+        values = 2.0 * times
+        slopes = numpy.full(11, 2.0)
+        types = ["linear"] * 11
+
+        deleted = core.prunableIndices(times, values, slopes, slopes, types, types, 0.0001)
+
+        numpy.testing.assert_array_equal(deleted, numpy.arange(1, 10))
+        self.assertLessEqual(
+            curve_error(times, values, slopes, slopes, types, types, deleted), 0.0001)
+
+    def test_sine(self):
+        """Some keys of a densely keyed sine wave are deleted, within tolerance."""
+        times = numpy.arange(0.0, 100.0, 2.0)
+        values = numpy.sin(times / 8.0)
+        slopes = numpy.cos(times / 8.0) / 8.0
+        types = ["fixed"] * len(times)
+        tolerance = 0.01
+
+        deleted = core.prunableIndices(times, values, slopes, slopes, types, types, tolerance)
+
+        self.assertGreater(len(deleted), 0)
+        self.assertLess(len(deleted), len(times) - 2)
+        self.assertLessEqual(
+            curve_error(times, values, slopes, slopes, types, types, deleted), tolerance)
+
+    def test_sine_candidates(self):
+        """Only candidate keys are deleted."""
+        times = numpy.arange(0.0, 100.0, 2.0)
+        values = numpy.sin(times / 8.0)
+        slopes = numpy.cos(times / 8.0) / 8.0
+        types = ["fixed"] * len(times)
+        candidates = numpy.arange(0, len(times), 3)
+
+        deleted = core.prunableIndices(
+            times, values, slopes, slopes, types, types, 0.01, candidates=candidates)
+
+        self.assertTrue(numpy.isin(deleted, candidates).all())
+        self.assertLessEqual(
+            curve_error(times, values, slopes, slopes, types, types, deleted), 0.01)
+
+    def test_stepped(self):
+        """Stepped keys holding the previous value are deleted, steps and ends are kept."""
+        times = numpy.arange(8.0)
+        values = numpy.array([0.0, 0.0, 0.0, 1.0, 1.0, 1.0, 2.0, 2.0])
+        slopes = numpy.zeros(8)
+        in_types = ["flat"] * 8
+        out_types = ["step"] * 8
+
+        deleted = core.prunableIndices(
+            times, values, slopes, slopes, in_types, out_types, 0.0001)
+
+        numpy.testing.assert_array_equal(deleted, [1, 2, 4, 5])
+        self.assertLessEqual(
+            curve_error(times, values, slopes, slopes, in_types, out_types, deleted), 0.0001)
+
+
+class TestRedundantIndices(unittest.TestCase):
+
+    def test_runs(self):
+        """Inner keys of runs of equal values are redundant, run ends are kept."""
+        values = [0.0, 0.0, 0.0, 1.0, 1.0, 1.0, 1.0, 2.0, 2.0]
+        numpy.testing.assert_array_equal(core.redundantIndices(values, 0.0001), [1, 4, 5])
+
+    def test_stepped(self):
+        """Deleting redundant keys of a stepped curve leaves it unchanged."""
+        times = numpy.arange(9.0)
+        values = numpy.array([0.0, 0.0, 0.0, 1.0, 1.0, 1.0, 1.0, 2.0, 2.0])
+        slopes = numpy.zeros(9)
+        types = ["step"] * 9
+
+        deleted = core.redundantIndices(values, 0.0001)
+        self.assertLessEqual(
+            curve_error(times, values, slopes, slopes, types, types, deleted), 0.0001)
+
+
+class TestAnalyzeCurve(unittest.TestCase):
+
+    def setUp(self):
+        times = numpy.arange(0.0, 100.0, 2.0)
+        self.data = [
+            times, numpy.sin(times / 8.0), numpy.cos(times / 8.0) / 8.0,
+            numpy.cos(times / 8.0) / 8.0, ["fixed"] * len(times), ["fixed"] * len(times), False]
+
+    def test_weighted(self):
+        """Weighted curves are skipped in evaluate mode, and analyzed by value otherwise."""
+        self.data[-1] = True
+        self.assertIsNone(core.analyzeCurve(("c", self.data, None, 0.01, True))[1])
+
+        values = numpy.array([1.0, 1.0, 1.0, 2.0])
+        self.data[1] = values
+        self.data[0] = numpy.arange(4.0)
+        _, deleted = core.analyzeCurve(("c", self.data, None, 0.01, False))
+        numpy.testing.assert_array_equal(deleted, [1])
+
+    def test_unweighted(self):
+        """Unweighted curves in evaluate mode match prunableIndices."""
+        _, deleted = core.analyzeCurve(("c", self.data, None, 0.01, True))
+        numpy.testing.assert_array_equal(
+            deleted, core.prunableIndices(*(self.data[:6] + [0.01])))
+
+
+class TestStaticCurveMask(unittest.TestCase):
+
+    def test_mask(self):
+        """Only curves with level values and level tangents are static."""
+        counts = [3, 2, 2, 1]
+        values = [1.0, 1.0, 1.0, 0.0, 0.0, 0.0, 1.0, 5.0]
+        in_angles = [0.0, 0.0, 0.0, 0.0, 30.0, 0.0, 0.0, 45.0]
+        out_angles = [0.0] * 8
+        in_types = ["flat", "flat", "flat", "linear", "fixed", "flat", "flat", "linear"]
+        out_types = ["flat"] * 8
+
+        mask = core.staticCurveMask(
+            counts, values, in_angles, out_angles, in_types, out_types, 0.0001)
+
+        numpy.testing.assert_array_equal(mask, [True, False, False, True])
+
+
+if __name__ == '__main__':
+    unittest.main()
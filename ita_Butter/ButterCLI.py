@@ -0,0 +1,207 @@
+#!/bin/python
+
+"""
+Butter command line: filter exported curve files without Maya.
+
+Files hold a time column followed by one column per channel, as CSV with a
+header row or as NPZ with a "time" array and one array per channel. Keys are
+assumed to be evenly spaced in time, as they are in the interactive filter.
+
+Cutoffs are given as shown in the Butter window's spin boxes.
+
+Usage:
+======
+python ButterCLI.py --pass lowpass --high 0.05 take_*.csv
+python ButterCLI.py --pass bandpass --low 0.0005 --high 0.1 -o clean/ take.npz
+python ButterCLI.py --pass lowpass --high 0.05 --periodic --in-place cycle.csv
+
+----
+(c) Jeffrey "italic" Hoover
+italic DOT rendezvous AT gmail DOT com
+
+Licensed under the Apache 2.0 license.
+This script can be used for non-commercial
+and commercial projects free of charge.
+For more information, visit:
+https://www.apache.org/licenses/LICENSE-2.0
+"""
+
+import os
+import sys
+import site
+import argparse
+import logging
+from multiprocessing import Pool
+
+deps_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'deps')
+site.addsitedir(deps_path)
+
+import numpy
+import scipy_interface
+
+
+log = logging.getLogger(__name__)
+
+
+# File IO =====================================================================
+
+def read_curves(path):
+    # type: (str) -> Tuple(numpy.ndarray, List[str], numpy.ndarray)
+    """
+    :param path: CSV or NPZ file.
+
+    :return time: Time column.
+    :return names: Channel names.
+    :return data: 2D array with one column per channel.
+    """
+    if path.lower().endswith(".npz"):
+        with numpy.load(path) as archive:
+            names = [name for name in archive.files if name != "time"]
+            time = archive["time"]
+            data = numpy.column_stack([archive[name] for name in names])
+    else:
+        with open(path) as f:
+            header = f.readline().strip().split(",")
+        table = numpy.loadtxt(path, delimiter=",", skiprows=1, ndmin=2)
+        names = [name.strip() for name in header[1:]]
+        time = table[:, 0]
+        data = table[:, 1:]
+
+    return time, names, data
+
+
+def write_curves(path, time, names, data):
+    # type: (str, numpy.ndarray, List[str], numpy.ndarray) -> None
+    """
+    :param path: CSV or NPZ file, same layout as read_curves.
+    :param time: Time column.
+    :param names: Channel names.
+    :param data: 2D array with one column per channel.
+    """
+    if path.lower().endswith(".npz"):
+        arrays = dict(zip(names, data.T))
+        arrays["time"] = time
+        numpy.savez(path, **arrays)
+    else:
+        numpy.savetxt(
+            path, numpy.column_stack((time, data)),
+            delimiter=",", header=",".join(["time"] + names), comments="")
+
+
+def output_path(path, output_dir=None, suffix="_filtered", in_place=False):
+    # type: (str, str, str, bool) -> str
+    """Path to write the filtered result of path to."""
+    if in_place:
+        return path
+    root, ext = os.path.splitext(os.path.basename(path))
+    directory = output_dir or os.path.dirname(path)
+    return os.path.join(directory, root + suffix + ext)
+
+
+# Filtering ===================================================================
+
+def filter_curves(data, low, high, order, pass_type, periodic=False):
+    # type: (numpy.ndarray, float, float, int, str, bool) -> numpy.ndarray
+    """
+    Filter every channel with the same engines as the interactive filter.
+
+    :param data: 2D array with one column per channel.
+    :param low: Low-end cutoff for highpass filter.
+    :param high: High-end cutoff for lowpass filter.
+    :param order: Order index of filter.
+    :param pass_type: {"lowpass", "highpass", "bandpass"}
+    :param periodic: Filter channels as loops, as Butter does for cycled curves.
+
+    :return: 2D array of filtered channels.
+    """
+    b, a = scipy_interface.create_filter(low, high, order, pass_type=pass_type)
+    engine = scipy_interface.filter_list_periodic if periodic else scipy_interface.filter_list
+    return numpy.column_stack([engine(b, a, channel) for channel in data.T])
+
+
+def filter_file(job):
+    # type: (Tuple(str, str, dict)) -> str
+    """
+    Read, filter and write a single file. Runs in a worker process.
+
+    :param job: Tuple of input path, output path and filter_curves keyword arguments.
+    :return: Output path.
+    """
+    path, out_path, params = job
+    time, names, data = read_curves(path)
+
+    order = numpy.argsort(time, kind="mergesort")
+    time, data = time[order], data[order]
+    steps = numpy.diff(time)
+    if steps.size and numpy.ptp(steps) > 1e-6 * max(abs(steps.mean()), 1.0):
+        log.warning("{}: keys are not evenly spaced in time".format(path))
+
+    write_curves(out_path, time, names, filter_curves(data, **params))
+    return out_path
+
+
+# Command line ================================================================
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Butterworth filter for exported animation curve files (CSV or NPZ).")
+    parser.add_argument("files", nargs="+", help="CSV or NPZ files: time column plus channel columns.")
+    parser.add_argument(
+        "--pass", dest="pass_type", default="lowpass",
+        choices=("lowpass", "highpass", "bandpass"), help="Filter type.")
+    parser.add_argument("--low", type=float, default=None, help="Minimum frequency, as in the Butter window.")
+    parser.add_argument("--high", type=float, default=None, help="Maximum frequency, as in the Butter window.")
+    parser.add_argument("--order", type=int, default=4, help="Filter order.")
+    parser.add_argument(
+        "--periodic", action="store_true",
+        help="Filter channels as loops, for curves that cycle.")
+    parser.add_argument("-o", "--output-dir", default=None, help="Directory for filtered files.")
+    parser.add_argument("--suffix", default="_filtered", help="Suffix for filtered file names.")
+    parser.add_argument("--in-place", action="store_true", help="Overwrite input files.")
+    parser.add_argument("-j", "--jobs", type=int, default=None, help="Worker processes. Defaults to CPU count.")
+    args = parser.parse_args(argv)
+
+    if args.pass_type in ("highpass", "bandpass") and args.low is None:
+        parser.error("--low is required for {}".format(args.pass_type))
+    if args.pass_type in ("lowpass", "bandpass") and args.high is None:
+        parser.error("--high is required for {}".format(args.pass_type))
+
+    return args
+
+
+def main(argv=None):
+    """Filter all given files in a process pool. Returns the number of failures."""
+    logging.basicConfig(level=logging.INFO, format="%(levelname)s: %(message)s")
+    args = parse_args(argv)
+
+    if args.output_dir and not os.path.isdir(args.output_dir):
+        os.makedirs(args.output_dir)
+
+    params = {
+        "low": args.low, "high": args.high, "order": args.order,
+        "pass_type": args.pass_type, "periodic": args.periodic,
+    }
+    jobs = [
+        (path, output_path(path, args.output_dir, args.suffix, args.in_place), params)
+        for path in args.files
+    ]
+
+    failures = 0
+    pool = Pool(processes=args.jobs)
+    try:
+        results = [(job[0], pool.apply_async(filter_file, (job,))) for job in jobs]
+        for path, result in results:
+            try:
+                log.info("{} -> {}".format(path, result.get()))
+            except Exception as e:
+                failures += 1
+                log.error("{}: {}".format(path, e))
+    finally:
+        pool.close()
+        pool.join()
+
+    return failures
+
+
+if __name__ == '__main__':
+    sys.exit(1 if main() else 0)
@@ -1,11 +1,154 @@
 """UI classes for ita_Butter."""
 
+import math
+
+import numpy
+
 from utils.qtshim import QtCore, QtGui, QtWidgets, logging
+import scipy_interface
 Signal = QtCore.Signal
 
 log = logging.getLogger(__name__)
 
 
+class CurvePlot(QtWidgets.QWidget):
+
+    """
+    Plot of the active curve's signal and power spectrum.
+
+    Signals are min/max decimated to the widget's width, so drawing cost
+    depends on pixels rather than on key count.
+    """
+
+    def __init__(self, parent=None):
+        """:param parent: Widget to place the plot under."""
+        super(CurvePlot, self).__init__(parent=parent)
+        self.setMinimumHeight(160)
+        self.setMaximumHeight(160)
+        self._original = None
+        self._filtered = None
+        self._log_freqs = None
+        self._power = None
+        self._cutoff = ()
+        self._envelopes = {}
+
+    def set_signal(self, values):
+        """
+        Set the original signal. Clears any filtered signal.
+
+        :param values: Numpy array of key values.
+        """
+        self._original = numpy.asarray(values, dtype=float)
+        self._filtered = None
+        self._envelopes.clear()
+        self.update()
+
+    def set_filtered(self, values):
+        """:param values: Filtered key values of the active curve."""
+        self._filtered = numpy.asarray(values, dtype=float)
+        self._envelopes.pop("filtered", None)
+        self.update()
+
+    def set_spectrum(self, freqs, power):
+        """
+        Set the power spectrum of the original signal.
+
+        :param freqs: Numpy array of frequencies normalized to Nyquist.
+        :param power: Numpy array of power in decibels.
+        """
+        self._log_freqs = numpy.log10(freqs)
+        self._power = numpy.asarray(power, dtype=float)
+        self._envelopes.pop("spectrum", None)
+        self.update()
+
+    def set_cutoff(self, low, high, pass_type):
+        """Mark the filter's critical frequencies on the spectrum."""
+        if pass_type == "lowpass":
+            self._cutoff = (high,)
+        elif pass_type == "highpass":
+            self._cutoff = (low,)
+        else:
+            self._cutoff = (low, high)
+        self.update()
+
+    def clear(self):
+        """Remove all plotted data."""
+        self._original = None
+        self._filtered = None
+        self._log_freqs = None
+        self._power = None
+        self._cutoff = ()
+        self._envelopes.clear()
+        self.update()
+
+    def resizeEvent(self, *args, **kwargs):
+        """Envelopes are bound to pixel width; rebuild on resize."""
+        self._envelopes.clear()
+        super(CurvePlot, self).resizeEvent(*args, **kwargs)
+
+    def __envelope(self, name, x, y, x_range):
+        width = self.width()
+        cached = self._envelopes.get(name)
+        if cached is None or cached[0] != width:
+            cached = (width, scipy_interface.minmax_decimate(x, y, width, x_range))
+            self._envelopes[name] = cached
+        return cached[1]
+
+    @staticmethod
+    def __polygon(envelope, rect, y_low, y_high):
+        columns, y_min, y_max = envelope
+        y_span = (y_high - y_low) or 1.0
+        polygon = QtGui.QPolygonF()
+        for col, lo, hi in zip(columns, y_min, y_max):
+            x = rect.left() + col
+            polygon.append(QtCore.QPointF(x, rect.bottom() - (lo - y_low) / y_span * rect.height()))
+            polygon.append(QtCore.QPointF(x, rect.bottom() - (hi - y_low) / y_span * rect.height()))
+        return polygon
+
+    def paintEvent(self, event):
+        """Draw signal on top, spectrum on the bottom."""
+        painter = QtGui.QPainter(self)
+        painter.fillRect(self.rect(), self.palette().color(QtGui.QPalette.Base))
+
+        half = self.height() // 2
+        signal_rect = QtCore.QRectF(0, 2, self.width(), half - 4)
+        spectrum_rect = QtCore.QRectF(0, half + 2, self.width(), half - 4)
+
+        if self._original is not None and self._original.size:
+            positions = numpy.arange(self._original.size)
+            x_range = (0, self._original.size - 1)
+            y_low, y_high = self._original.min(), self._original.max()
+
+            original = self.__envelope("original", positions, self._original, x_range)
+            painter.setPen(QtGui.QPen(QtGui.QColor(128, 128, 128)))
+            painter.drawPolyline(self.__polygon(original, signal_rect, y_low, y_high))
+
+            if self._filtered is not None:
+                filtered = self.__envelope("filtered", positions, self._filtered, x_range)
+                painter.setPen(QtGui.QPen(QtGui.QColor(240, 160, 40)))
+                painter.drawPolyline(self.__polygon(filtered, signal_rect, y_low, y_high))
+
+        if self._log_freqs is not None and self._log_freqs.size:
+            # Nyquist (1.0) is the right edge
+            x_range = (self._log_freqs[0], 0.0)
+            spectrum = self.__envelope("spectrum", self._log_freqs, self._power, x_range)
+            painter.setPen(QtGui.QPen(QtGui.QColor(80, 160, 220)))
+            painter.drawPolyline(self.__polygon(
+                spectrum, spectrum_rect, self._power.min(), self._power.max()))
+
+            painter.setPen(QtGui.QPen(QtGui.QColor(220, 60, 60)))
+            span = x_range[1] - x_range[0]
+            for freq in self._cutoff:
+                if freq <= 0:
+                    continue
+                x = (math.log10(freq) - x_range[0]) / span * (self.width() - 1)
+                painter.drawLine(
+                    QtCore.QPointF(x, spectrum_rect.top()),
+                    QtCore.QPointF(x, spectrum_rect.bottom()))
+
+        painter.end()
+
+
 class ButterWindow(QtWidgets.QMainWindow):
 
     """Main Window."""
@@ -23,14 +166,14 @@ class ButterWindow(QtWidgets.QMainWindow):
         self.__set_connections()
         self.__place_ui()
         self.move(self.settings.value("mainwindow/position", QtCore.QPoint(0, 0)))
-        self.resize(370, 210)
+        self.resize(370, 395)
         self._ButterHelp = None
 
     def __setup_ui(self):
         self.setObjectName("ButterWindow")
         self.setWindowTitle("Butter")
-        self.setMinimumSize(232, 210)
-        self.setMaximumSize(1280, 210)
+        self.setMinimumSize(232, 395)
+        self.setMaximumSize(1280, 395)
         font = QtGui.QFont()
         font.setPointSize(8)
         font.setFamily("Arial")
@@ -107,6 +250,20 @@ class ButterWindow(QtWidgets.QMainWindow):
         self.sliderValMax.setButtonSymbols(QtWidgets.QAbstractSpinBox.UpDownArrows)
         self.sliderValMax.setSingleStep(0.001)
 
+        # Signal and spectrum of the active curve
+        self.plot = CurvePlot()
+        self.plot.setSizePolicy(self.FrameSizePolicy)
+        self.plot.setToolTip(
+            "Active curve: original (grey) and filtered (orange).\n"
+            "Power spectrum (blue) with cutoff frequencies (red).")
+
+        # Latency readout of the last tick
+        self.labelTiming = QtWidgets.QLabel()
+        self.labelTiming.setSizePolicy(self.FrameSizePolicy)
+        self.labelTiming.setToolTip(
+            "Last update: total and per-stage time in milliseconds,\n"
+            "curves and keys processed.")
+
         self.start_filter = QtWidgets.QPushButton(text="Start interactive filter")
         self.end_filter = QtWidgets.QPushButton(text="Exit filter")
         self.help_button = QtWidgets.QPushButton(text="Help...")
@@ -131,6 +288,8 @@ class ButterWindow(QtWidgets.QMainWindow):
         self.LayoutVert1.addLayout(self.radioRow)
         self.LayoutVert1.addWidget(self.FrameMinFreq)
         self.LayoutVert1.addWidget(self.FrameMaxFreq)
+        self.LayoutVert1.addWidget(self.plot)
+        self.LayoutVert1.addWidget(self.labelTiming)
 
         self.LayoutVert1.addWidget(self.start_filter)
         self.LayoutVert1.addWidget(self.end_filter)
@@ -233,6 +392,10 @@ class ButterWindow(QtWidgets.QMainWindow):
         pass_type = "bandpass" if self.radioBandPass.isChecked() else "lowpass"
         self.SlidersChangedSig.emit(self.sliderMin.value(), high_value, pass_type)
 
+    def set_timing(self, text):
+        """:param text: Latency readout of the last filter update."""
+        self.labelTiming.setText(text)
+
     def closeEvent(self, *args, **kwargs):
         """Custom closeEvent to write settings to files."""
         self.settings.setValue("mainwindow/position", self.pos())
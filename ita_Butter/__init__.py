@@ -25,6 +25,8 @@ Use the sliders to start filtering curves:
 Exit the filter by clicking Exit filter.
 Undo or redo as necessary.
 
+Curves set to cycle infinity are filtered as loops to keep the seam closed.
+
 For help, see README.md or open the help through the tool interface.
 
 ----
@@ -52,6 +54,8 @@ import pymel.core as pmc
 
 from utils.qtshim import QtCore, logging
 from utils.mayautils import get_maya_window  # UndoChunk
+from utils.timing import StageTimer, format_tick
+from ita_Progress import Progress
 from ButterUI import ButterWindow
 
 deps_path = os.path.join(os.path.dirname(__file__), 'deps')
@@ -69,19 +73,55 @@ log.setLevel(logging.WARN)
 
 _Butter = None
 _CurveDict = None
+_ActiveCurve = None
+_CycledCurves = None
 _FilterOrder = 4
+_Timer = StageTimer()
 
 
 # Data builders ===============================================================
 
 def __reset_settings():
-    global _CurveDict
+    global _CurveDict, _ActiveCurve, _CycledCurves
     _CurveDict = None
+    _ActiveCurve = None
+    _CycledCurves = None
+    _Butter.plot.clear()
 
 
 def __construct_settings():
-    global _CurveDict
-    _CurveDict = __build_key_dict()
+    global _CurveDict, _ActiveCurve, _CycledCurves
+    _Timer.reset()
+    _Timer.start_tick("start")
+    with _Timer.stage("read"):
+        curves = __get_curves()
+        _CurveDict = __build_key_dict(curves)
+        curves = [crv for crv in curves if crv in _CurveDict]
+        _ActiveCurve = curves[0] if curves else None
+        _CycledCurves = {
+            crv for crv in curves
+            if __is_cycled(crv) and len(_CurveDict[crv]) == crv.numKeys()
+        }
+    _Timer.count("curves", len(_CurveDict))
+    _Timer.count("keys", sum(len(kmap) for kmap in _CurveDict.itervalues()))
+    with _Timer.stage("plot"):
+        __plot_active_curve()
+    __show_timing()
+
+
+def __show_timing():
+    tick = _Timer.end_tick()
+    _Butter.set_timing(format_tick(tick))
+
+
+def __plot_active_curve():
+    """Plot the active curve. Its spectrum is computed once per session."""
+    if _ActiveCurve is None:
+        _Butter.plot.clear()
+        return
+    vals = _CurveDict[_ActiveCurve].values()
+    _Butter.plot.set_signal(vals)
+    _Butter.plot.set_spectrum(*scipy_interface.power_spectrum(vals))
 
 
 def __set_key_values(anim_curve=None, data=None):
@@ -102,9 +142,26 @@ def __get_key_values(anim_curve=None):
     return OrderedDict(sorted(unordered.iteritems(), key=lambda x: x[0]))
 
 
-def __build_key_dict():
-    # type: () -> Dict[pmc.nodetypes.AnimCurve, Dict[int, float]]
-    return {crv: __get_key_values(crv) for crv in __get_curves()}
+def __build_key_dict(curves):
+    # type: (List[pmc.nodetypes.AnimCurve]) -> Dict[pmc.nodetypes.AnimCurve, Dict[int, float]]
+    """Read keys of all curves. Cancelling returns an empty dict."""
+    key_dict = {}
+    with Progress("Butter", len(curves), status="Reading curves...") as progress:
+        for crv in curves:
+            if progress.step():
+                log.warning("Cancelled reading curves")
+                return {}
+            key_dict[crv] = __get_key_values(crv)
+    return key_dict
+
+
+def __is_cycled(anim_curve=None):
+    # type: (pmc.nodetypes.AnimCurve) -> bool
+    """Curve loops with pre- or post-infinity set to cycle."""
+    infinity = \
+        pmc.setInfinity(anim_curve, q=True, preInfinite=True) + \
+        pmc.setInfinity(anim_curve, q=True, postInfinite=True)
+    return "cycle" in infinity
 
 
 def __get_curves():
@@ -142,19 +199,47 @@ def scipy_send(low, high, pass_type):
     low = low * 0.00001   # Subject to fine-tuning
     high = high * 0.001  # Subject to fine-tuning
     if _CurveDict:
-        b, a = scipy_interface.create_filter(low, high, _FilterOrder, pass_type=pass_type)
+        _Timer.start_tick()
+        with _Timer.stage("design"):
+            b, a = scipy_interface.create_filter(low, high, _FilterOrder, pass_type=pass_type)
         for (crv, kmap) in _CurveDict.iteritems():
-            keys = kmap.keys()
-            vals = kmap.values()
+            with _Timer.stage("read"):
+                keys = kmap.keys()
+                vals = kmap.values()
 
-            new_vals = scipy_interface.filter_list(b, a, vals)
+            with _Timer.stage("filter"):
+                if crv in _CycledCurves:
+                    new_vals = scipy_interface.filter_list_periodic(b, a, vals)
+                else:
+                    new_vals = scipy_interface.filter_list(b, a, vals)
 
             log.debug("Order:    {}".format(_FilterOrder))
             log.debug("Pass:     {}".format(pass_type))
             log.debug("Original: {}".format(vals))
             log.debug("Filtered: {}".format(new_vals))
 
-            __set_key_values(anim_curve=crv, data=dict(zip(keys, new_vals)))
+            with _Timer.stage("write"):
+                __set_key_values(anim_curve=crv, data=dict(zip(keys, new_vals)))
+
+            _Timer.count("curves")
+            _Timer.count("keys", len(keys))
+
+            if crv == _ActiveCurve:
+                with _Timer.stage("plot"):
+                    _Butter.plot.set_filtered(new_vals)
+
+        _Butter.plot.set_cutoff(low, high, pass_type)
+        __show_timing()
+
+
+def dump_timings(path):
+    """
+    Write the timing summary of the current or last filter session to a JSON file.
+
+    :param path: File path to write.
+    """
+    _Timer.dump(path)
+    log.info("Timings written to {}".format(path))
 
 
 def __set_connections():
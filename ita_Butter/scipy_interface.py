@@ -6,7 +6,11 @@ to pass into respective functions and returned as pure Python.
 """
 
 
-from utils.qtshim import logging
+try:
+    from utils.qtshim import logging
+except ImportError:
+    # Headless use without a Qt binding, see ButterCLI
+    import logging
 log = logging.getLogger(__name__)
 
 try:
@@ -65,3 +69,87 @@ def filter_list(b, a, data):
     y = y.tolist()
 
     return y
+
+
+def filter_list_periodic(b, a, data):
+    # type: (List[float], List[float], List[float]) -> List[float]
+    """
+    Filter one period of a looping signal in the frequency domain.
+
+    Applies the same zero-phase response as filter_list, but wraps around the
+    loop instead of padding. The last sample is the start of the next cycle,
+    so it receives the filtered first sample and the seam stays closed.
+
+    :param b: Numerator polynomial Numpy array of the filter.
+    :param a: Denominator polynomial Numpy array of the filter.
+    :param data: Python list of data to be filtered, first through last key of the cycle.
+
+    :return y: Python list of filtered data - converted from Numpy array.
+    """
+    data = numpy.asarray(data, dtype=float)
+    period = data[:-1]
+    if period.size < 2:
+        return data.tolist()
+
+    # filtfilt's zero-phase response is |H|^2
+    omega = numpy.fft.rfftfreq(period.size) * 2.0 * numpy.pi
+    _, h = sig.freqz(b, a, worN=omega)
+    y = numpy.fft.irfft(numpy.fft.rfft(period) * numpy.abs(h) ** 2, n=period.size)
+    y = numpy.append(y, y[0]).tolist()
+
+    return y
+
+
+def power_spectrum(data):
+    # type: (List[float]) -> Tuple(numpy.ndarray, numpy.ndarray)
+    """
+    :param data: Python list of data to analyze.
+
+    :return freqs: Frequencies normalized to Nyquist - same scale as the cutoffs passed to create_filter.
+    :return power: Power of each frequency in decibels.
+    :return type: Numpy arrays
+    """
+    data = numpy.asarray(data, dtype=float)
+    if data.size < 2:
+        return numpy.empty(0), numpy.empty(0)
+
+    spectrum = numpy.fft.rfft(data - data.mean())
+    freqs = numpy.fft.rfftfreq(data.size) * 2.0
+    power = 10.0 * numpy.log10(numpy.abs(spectrum) ** 2 + 1e-12)
+
+    # Drop the DC bin, it has no place on a log frequency axis
+    return freqs[1:], power[1:]
+
+
+def minmax_decimate(x, y, width, x_range=None):
+    # type: (List[float], List[float], int, Tuple(float, float)) -> Tuple(numpy.ndarray, numpy.ndarray, numpy.ndarray)
+    """
+    Reduce a signal to the minimum and maximum value of each pixel column.
+
+    :param x: Monotonically increasing sample positions.
+    :param y: Sample values.
+    :param width: Number of pixel columns to reduce to.
+    :param x_range: (start, end) positions mapped to the first and last column. Defaults to the first and last sample.
+
+    :return columns: Column index of every column that holds samples.
+    :return y_min: Minimum sample value in each column.
+    :return y_max: Maximum sample value in each column.
+    :return type: Numpy arrays
+    """
+    x = numpy.asarray(x, dtype=float)
+    y = numpy.asarray(y, dtype=float)
+    if x.size == 0 or width < 1:
+        return numpy.empty(0, dtype=int), numpy.empty(0), numpy.empty(0)
+
+    start, end = x_range if x_range is not None else (x[0], x[-1])
+    span = (end - start) or 1.0
+
+    columns = ((x - start) / span * (width - 1)).astype(int).clip(0, width - 1)
+    # Positions are sorted, so each column is a contiguous run of samples
+    starts = numpy.flatnonzero(numpy.r_[True, columns[1:] != columns[:-1]])
+
+    return (
+        columns[starts],
+        numpy.minimum.reduceat(y, starts),
+        numpy.maximum.reduceat(y, starts),
+    )
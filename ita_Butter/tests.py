@@ -4,11 +4,16 @@ Tests for ita_Butter.
 Test interaction with scipy and UI.
 """
 
+import os
+import shutil
+import tempfile
 import unittest
 import matplotlib.pyplot as plt
 import numpy
 import scipy.signal as sig
 import scipy_interface
+import ButterCLI
+from ita_Progress import Progress
 
 
 class TestScipy(unittest.TestCase):
@@ -123,6 +128,89 @@ class TestScipy(unittest.TestCase):
 
         self.assertIsInstance(y, list)
 
+    def test_filter_periodic(self):
+        """Looping signal stays closed and matches filtfilt on a repeated loop."""
+        b, a = sig.butter(4, 0.1)
+        t = numpy.arange(201)
+        x = numpy.sin(2 * numpy.pi * t / 200.0) + 0.2 * numpy.sin(2 * numpy.pi * 40 * t / 200.0)
+
+        y = scipy_interface.filter_list_periodic(b, a, x.tolist())
+
+        self.assertIsInstance(y, list)
+        self.assertEqual(len(y), len(x))
+        self.assertAlmostEqual(y[0], y[-1])
+
+        repeated = sig.filtfilt(b, a, numpy.tile(x[:-1], 5))
+        numpy.testing.assert_allclose(y[:-1], repeated[400:600], atol=1e-6)
+
+    def test_power_spectrum(self):
+        """Spectrum peak lands on the tone's Nyquist-normalized frequency."""
+        x = numpy.sin(2 * numpy.pi * 0.1 * numpy.arange(1000))
+
+        freqs, power = scipy_interface.power_spectrum(x.tolist())
+
+        self.assertEqual(len(freqs), len(power))
+        self.assertAlmostEqual(freqs[numpy.argmax(power)], 0.2, places=3)
+
+    def test_minmax_decimate(self):
+        """Decimation keeps every extreme within its pixel column."""
+        x = numpy.arange(1000000)
+        y = numpy.random.RandomState(0).randn(x.size)
+        y[123456] = 50.0
+
+        columns, y_min, y_max = scipy_interface.minmax_decimate(x, y, 400)
+
+        self.assertEqual(len(columns), 400)
+        self.assertEqual(y_max.max(), 50.0)
+        self.assertEqual(y_min.min(), y.min())
+        self.assertTrue((y_min <= y_max).all())
+
+
+class TestCLI(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp)
+
+    def test_roundtrip(self):
+        """CSV and NPZ files filter to the same result as filter_list."""
+        t = numpy.arange(300.0)
+        x = numpy.sin(t / 20.0) + 0.1 * numpy.random.RandomState(0).randn(t.size)
+        b, a = scipy_interface.create_filter(None, 0.05, 4, pass_type="lowpass")
+        expected = scipy_interface.filter_list(b, a, x)
+
+        for name in ("take.csv", "take.npz"):
+            path = os.path.join(self.tmp, name)
+            ButterCLI.write_curves(path, t, ["tx"], x[:, None])
+            failures = ButterCLI.main(["--pass", "lowpass", "--high", "0.05", "-j", "1", path])
+            self.assertEqual(failures, 0)
+
+            time, names, data = ButterCLI.read_curves(ButterCLI.output_path(path))
+            self.assertEqual(names, ["tx"])
+            numpy.testing.assert_allclose(time, t)
+            numpy.testing.assert_allclose(data[:, 0], expected, atol=1e-9)
+
+
+class TestProgress(unittest.TestCase):
+
+    def test_subtask_range(self):
+        """Sub-tasks fill their share of the parent and cancel it."""
+        with Progress("test", 4, headless=True, interval=0) as progress:
+            progress.step()
+            with progress.subtask(10, steps=2) as sub:
+                for i in range(5):
+                    sub.step()
+                self.assertAlmostEqual(sub._position(), 50.0)
+            self.assertAlmostEqual(progress._position(), 75.0)
+
+            with progress.subtask(3) as sub:
+                sub.cancel()
+                self.assertTrue(sub.step())
+            self.assertTrue(progress.cancelled)
+            self.assertTrue(progress.step())
+
 
 if __name__ == '__main__':
     unittest.main()
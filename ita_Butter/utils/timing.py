@@ -0,0 +1,135 @@
+"""
+Per-stage timing for interactive tools.
+
+A tick is one pass of a repeated operation, such as a slider update. Each tick
+is broken down into named stages and counters. The last tick and a rolling
+window of recent ticks are kept for readouts and session summaries.
+"""
+
+import json
+from collections import OrderedDict, deque
+from contextlib import contextmanager
+from timeit import default_timer
+
+
+class StageTimer(object):
+
+    """Time named stages of repeated ticks."""
+
+    def __init__(self, history=500):
+        """:param history: Number of recent ticks kept for the session summary."""
+        self.history = deque(maxlen=history)
+        self.last = None
+        self._tick = None
+        self._start = None
+
+    def reset(self):
+        """Forget all recorded ticks."""
+        self.history.clear()
+        self.last = None
+        self._tick = None
+
+    def start_tick(self, label="tick"):
+        """
+        Begin timing a tick.
+
+        :param label: Kind of tick, summaries are grouped by label.
+        """
+        self._tick = {"label": label, "stages": OrderedDict(), "counts": OrderedDict()}
+        self._start = default_timer()
+
+    def end_tick(self):
+        """
+        Finish the current tick and record it.
+
+        :return: Tick dict with label, total, stages and counts. Times are in seconds.
+        """
+        tick = self._tick
+        if tick is None:
+            return None
+        tick["total"] = default_timer() - self._start
+        self.history.append(tick)
+        self.last = tick
+        self._tick = None
+        return tick
+
+    @contextmanager
+    def stage(self, name):
+        """
+        Time a block as part of the current tick. Repeated stages accumulate.
+
+        :param name: Stage name.
+        """
+        start = default_timer()
+        try:
+            yield
+        finally:
+            if self._tick is not None:
+                stages = self._tick["stages"]
+                stages[name] = stages.get(name, 0.0) + default_timer() - start
+
+    def count(self, name, amount=1):
+        """
+        Add to a counter of the current tick.
+
+        :param name: Counter name.
+        :param amount: Amount to add.
+        """
+        if self._tick is not None:
+            counts = self._tick["counts"]
+            counts[name] = counts.get(name, 0) + amount
+
+    def summary(self):
+        """
+        Summarize recorded ticks by label.
+
+        :return: Dict of label to tick count, mean and max total and per-stage times, and summed counters.
+        """
+        result = OrderedDict()
+        for tick in self.history:
+            entry = result.setdefault(tick["label"], {
+                "ticks": 0, "total": [], "stages": OrderedDict(), "counts": OrderedDict()})
+            entry["ticks"] += 1
+            entry["total"].append(tick["total"])
+            for name, value in tick["stages"].items():
+                entry["stages"].setdefault(name, []).append(value)
+            for name, value in tick["counts"].items():
+                entry["counts"][name] = entry["counts"].get(name, 0) + value
+
+        for entry in result.values():
+            entry["total"] = _stats(entry["total"])
+            for name, values in entry["stages"].items():
+                entry["stages"][name] = _stats(values)
+        return result
+
+    def dump(self, path):
+        """
+        Write the session summary and recorded ticks to a JSON file.
+
+        :param path: File path to write.
+        """
+        with open(path, "w") as f:
+            json.dump({"summary": self.summary(), "ticks": list(self.history)}, f, indent=2)
+
+
+def _stats(values):
+    return {"mean": sum(values) / len(values), "max": max(values)}
+
+
+def format_tick(tick):
+    """
+    Format a tick as a one-line readout.
+
+    :param tick: Tick dict returned from StageTimer.end_tick.
+    :return: Total and stage times in milliseconds, followed by counters.
+    """
+    if tick is None:
+        return ""
+    parts = ["{:.1f} ms".format(tick["total"] * 1000)]
+    if tick["stages"]:
+        parts.append("  ".join(
+            "{} {:.1f}".format(name, value * 1000) for name, value in tick["stages"].items()))
+    if tick["counts"]:
+        parts.append(", ".join(
+            "{} {}".format(value, name) for name, value in tick["counts"].items()))
+    return " | ".join(parts)
@@ -12,55 +12,36 @@ Signal = QtCore.Signal
 log = logging.getLogger(__name__)
 
 
-class QListItemCon(QtWidgets.QListWidgetItem):
+class ConEntry(object):
 
     """
     Save constraint data for immediate retrieval through the UI.
 
-    DAG path saved in scene from self.con_dag property.
+    The scene stores the constraint node's UUID, see ita_ConMan.track_con.
     """
 
-    def __init__(self, data, parent=None):
+    def __init__(self, data):
         """
-        Subset of QListWidgetItem to store constraint data in the UI.
+        Constraint data of one row of the constraint list.
 
         :param data: Dict with constraint type and node, constrained node, targets.
-        :param parent: Parent widget.
         """
-        super(QListItemCon, self).__init__(parent)
         self._data = data
-        self._entry_label = "{} | {} | {}".format(
-            str(self._data["object"]),
-            self._data["type"],
-            str(self._data["con_node"]))
-
-    def data(self, role):
-        """
-        Data to return for specific roles.
-
-        :param role: Specific Qt role to determine how data is returned.
-        """
-        if role == QtCore.Qt.DisplayRole:
-            return self.label
-        elif role == QtCore.Qt.UserRole:
-            return (self.con_node, self.obj, self.target)
+        self._entry_label = None
 
     @property
     def label(self):
-        """Label for display."""
+        """Label for display and sorting, cached until the next rename."""
+        if self._entry_label is None:
+            self._entry_label = "{} | {} | {}".format(
+                str(self._data["object"]),
+                self._data["type"],
+                str(self._data["con_node"]))
         return self._entry_label
 
-    @label.setter
-    def label(self, label):
-        self._entry_label = label
-
-    @QtCore.Slot()
-    def update_label_callback(self):
-        """Update label on name change."""
-        self.label = "{} | {} | {}".format(
-            str(self._data["object"]),
-            self._data["type"],
-            str(self._data["con_node"]))
+    def reset_label(self):
+        """Drop the cached label; it is rebuilt on next use."""
+        self._entry_label = None
 
     @property
     def con_type(self):
@@ -82,6 +63,16 @@ class QListItemCon(QtWidgets.QListWidgetItem):
         """Constraint node."""
         return self._data["con_node"]
 
+    @property
+    def uuid(self):
+        """UUID string of the constraint node."""
+        return self._data["handles"][0][0]
+
+    @property
+    def handle(self):
+        """MObjectHandle of the constraint node."""
+        return self._data["handles"][0][1]
+
     @property
     def object_dag(self):
         """DAG path of the constrained object."""
@@ -103,14 +94,102 @@ class QListItemCon(QtWidgets.QListWidgetItem):
         return (self.con_node.exists() and self.obj.exists())
 
 
+class ConListModel(QtCore.QAbstractListModel):
+
+    """Constraint entries, inserted and removed in bulk."""
+
+    def __init__(self, parent=None):
+        super(ConListModel, self).__init__(parent)
+        self._entries = []
+
+    def rowCount(self, parent=QtCore.QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self._entries)
+
+    def data(self, index, role=QtCore.Qt.DisplayRole):
+        """
+        Data to return for specific roles.
+
+        :param index: Model index of the entry.
+        :param role: Specific Qt role to determine how data is returned.
+        """
+        if not index.isValid():
+            return None
+        entry = self._entries[index.row()]
+        if role == QtCore.Qt.DisplayRole:
+            return entry.label
+        elif role == QtCore.Qt.UserRole:
+            return (entry.con_node, entry.obj, entry.target)
+        return None
+
+    def entry(self, row):
+        """ConEntry of a row."""
+        return self._entries[row]
+
+    def entries(self):
+        """All entries, in insertion order."""
+        return list(self._entries)
+
+    def add_entries(self, entries):
+        """
+        Append entries with a single insert.
+
+        :param entries: List of ConEntry.
+        """
+        if not entries:
+            return
+        first = len(self._entries)
+        self.beginInsertRows(QtCore.QModelIndex(), first, first + len(entries) - 1)
+        self._entries.extend(entries)
+        self.endInsertRows()
+
+    def remove_entries(self, entries):
+        """
+        Remove entries, one removal per run of adjacent rows.
+
+        :param entries: Entries to remove.
+        """
+        remove = set(entries)
+        rows = [row for row, entry in enumerate(self._entries) if entry in remove]
+        while rows:
+            last = rows.pop()
+            first = last
+            while rows and rows[-1] == first - 1:
+                first = rows.pop()
+            self.beginRemoveRows(QtCore.QModelIndex(), first, last)
+            del self._entries[first:last + 1]
+            self.endRemoveRows()
+
+    def clear(self):
+        """Remove all entries."""
+        self.beginResetModel()
+        del self._entries[:]
+        self.endResetModel()
+
+    def reset_labels(self, entries):
+        """
+        Rebuild labels of entries after their nodes were renamed.
+
+        :param entries: Entries to relabel.
+        """
+        relabel = set(entries)
+        for row, entry in enumerate(self._entries):
+            if entry in relabel:
+                entry.reset_label()
+                index = self.index(row)
+                self.dataChanged.emit(index, index)
+
+
 class ConManWindow(QtWidgets.QMainWindow):
 
     """Main window."""
 
     PurgeSig = Signal()
     CloseSig = Signal()
-    RenameSig = Signal()
-    ExistSig = Signal(tuple)
+    RenameSig = Signal(object)
+    ExistSig = Signal(object)
+    StaleSig = Signal(list, list)
     AddSig = Signal()
     DelSig = Signal(list)
     SelSig = Signal(list)
@@ -118,12 +197,15 @@ class ConManWindow(QtWidgets.QMainWindow):
     SwitchOffSig = Signal(tuple)
     SwitchSingleSig = Signal(tuple)
     SwitchAllSig = Signal(tuple)
+    BakeSig = Signal(list)
+    ScanSig = Signal(str)
 
     def __init__(self, parent=None):
         """:param parent: Window to place ConMan under."""
         super(ConManWindow, self).__init__(parent=parent)
         self.settings = QtCore.QSettings("italic", "ConMan2")
-        self.__StaleData = []
+        self.__StaleData = set()
+        self.__Index = {}
         self.__setup_ui()
         self.move(self.settings.value("mainwindowposition", QtCore.QPoint(0, 0)))
         self._CManHelp = None
@@ -151,12 +233,33 @@ class ConManWindow(QtWidgets.QMainWindow):
         self.LayoutVert1.setSpacing(2)
         self.LayoutVert1.setContentsMargins(5, -1, 5, -1)
 
-        self.ObjList = QtWidgets.QListWidget()
-        self.ObjList.setMinimumSize(QtCore.QSize(240, 125))
-        self.ObjList.setMaximumSize(QtCore.QSize(240, 125))
+        self.SearchField = QtWidgets.QLineEdit()
+        self.SearchField.setMinimumSize(QtCore.QSize(240, 20))
+        self.SearchField.setMaximumSize(QtCore.QSize(240, 20))
+        self.SearchField.setPlaceholderText("Search")
+        self.SearchField.setToolTip("Show only constraints whose label contains the text.")
+
+        self.ConModel = ConListModel(self)
+        self.ConProxy = QtCore.QSortFilterProxyModel(self)
+        self.ConProxy.setSourceModel(self.ConModel)
+        self.ConProxy.setFilterCaseSensitivity(QtCore.Qt.CaseInsensitive)
+        self.ConProxy.setSortCaseSensitivity(QtCore.Qt.CaseInsensitive)
+        self.ConProxy.setDynamicSortFilter(True)
+        self.ConProxy.sort(0, QtCore.Qt.AscendingOrder)
+
+        self.ObjList = QtWidgets.QListView()
+        self.ObjList.setModel(self.ConProxy)
+        self.ObjList.setUniformItemSizes(True)
+        self.ObjList.setEditTriggers(QtWidgets.QAbstractItemView.NoEditTriggers)
+        self.ObjList.setMinimumSize(QtCore.QSize(240, 103))
+        self.ObjList.setMaximumSize(QtCore.QSize(240, 103))
         self.ObjList.setFrameShape(QtWidgets.QFrame.NoFrame)
         self.ObjList.setFrameShadow(QtWidgets.QFrame.Plain)
-        self.ObjList.setToolTip("Click to see switching options.\nDouble click to select constrained object.")
+        self.ObjList.setSelectionMode(QtWidgets.QAbstractItemView.ExtendedSelection)
+        self.ObjList.setToolTip(
+            "Click to see switching options.\n"
+            "Ctrl or Shift click to switch several constraints at once.\n"
+            "Double click to select constrained object.")
 
         self.ButtonRow1 = QtWidgets.QHBoxLayout()
         self.ButtonRow1.setSpacing(0)
@@ -389,6 +492,11 @@ class ConManWindow(QtWidgets.QMainWindow):
         self.ButtonSwitch.setMinimumHeight(25)
         self.ButtonSwitch.setToolTip("Weight constraint to a single target.")
 
+        self.ButtonBake = QtWidgets.QPushButton(self.verticalLayoutWidget_2)
+        self.ButtonBake.setText("Bake")
+        self.ButtonBake.setMinimumHeight(25)
+        self.ButtonBake.setToolTip("Bake over the playback range and delete the constraint.")
+
         self.CheckVisTrans = QtWidgets.QCheckBox(self.verticalLayoutWidget_2)
         self.CheckVisTrans.setChecked(True)
         self.CheckVisTrans.setToolTip("Keep object in the same position\nby updating constraint offsets.")
@@ -408,6 +516,14 @@ class ConManWindow(QtWidgets.QMainWindow):
         self.ButtonHelp.setToolTip("Open help documentation.")
         self.ButtonHelp.setText("Help")
 
+        self.ButtonScan = QtWidgets.QPushButton(self.verticalLayoutWidget)
+        self.ButtonScan.setMinimumHeight(30)
+        self.ButtonScan.setFont(font)
+        self.ButtonScan.setToolTip(
+            "Add all parent, point, orient and scale constraints in the scene,\n"
+            "or in a namespace, to the list.")
+        self.ButtonScan.setText("Scan...")
+
         self.ButtonPurge = QtWidgets.QPushButton(self.verticalLayoutWidget)
         self.ButtonPurge.setMinimumHeight(30)
         self.ButtonPurge.setFont(font)
@@ -421,6 +537,7 @@ class ConManWindow(QtWidgets.QMainWindow):
         self.__set_tab_order()
 
     def __place_ui(self):
+        self.LayoutVert1.addWidget(self.SearchField)
         self.LayoutVert1.addWidget(self.ObjList)
         self.ButtonRow1.addWidget(self.ButtonAdd)
         self.ButtonRow1.addWidget(self.ButtonParent)
@@ -457,17 +574,20 @@ class ConManWindow(QtWidgets.QMainWindow):
         self.ButtonRow3.addWidget(self.ButtonOff)
         self.ButtonRow3.addWidget(self.ButtonAll)
         self.ButtonRow3.addWidget(self.ButtonSwitch)
+        self.ButtonRow3.addWidget(self.ButtonBake)
         self.SwitchCol.addLayout(self.ButtonRow3)
         self.SwitchCol.addWidget(self.CheckVisTrans)
         self.SwitchCol.addWidget(self.CheckKey)
         self.tabWidget.addTab(self.Switch, "Switch")
         self.LayoutVert1.addWidget(self.tabWidget)
         self.ButtonRow2.addWidget(self.ButtonHelp)
+        self.ButtonRow2.addWidget(self.ButtonScan)
         self.ButtonRow2.addWidget(self.ButtonPurge)
         self.LayoutVert1.addLayout(self.ButtonRow2)
         self.setCentralWidget(self.centralwidget)
 
     def __set_tab_order(self):
+        self.setTabOrder(self.SearchField, self.ObjList)
         self.setTabOrder(self.ObjList, self.ButtonAdd)
         self.setTabOrder(self.ButtonAdd, self.ButtonParent)
         self.setTabOrder(self.ButtonParent, self.ButtonPoint)
@@ -496,14 +616,18 @@ class ConManWindow(QtWidgets.QMainWindow):
         self.setTabOrder(self.MenuSwitchTarget, self.ButtonOff)
         self.setTabOrder(self.ButtonOff, self.ButtonAll)
         self.setTabOrder(self.ButtonAll, self.ButtonSwitch)
-        self.setTabOrder(self.ButtonSwitch, self.CheckVisTrans)
+        self.setTabOrder(self.ButtonSwitch, self.ButtonBake)
+        self.setTabOrder(self.ButtonBake, self.CheckVisTrans)
         self.setTabOrder(self.CheckVisTrans, self.CheckKey)
         self.setTabOrder(self.CheckKey, self.ButtonHelp)
-        self.setTabOrder(self.ButtonHelp, self.ButtonPurge)
+        self.setTabOrder(self.ButtonHelp, self.ButtonScan)
+        self.setTabOrder(self.ButtonScan, self.ButtonPurge)
 
     def __set_connections(self):
-        self.ObjList.currentItemChanged.connect(self.__item_list_changed)
-        self.ObjList.itemDoubleClicked.connect(self.__item_list_double_click)
+        self.SearchField.textChanged.connect(self.ConProxy.setFilterFixedString)
+        self.ObjList.selectionModel().currentChanged.connect(self.__item_list_changed)
+        self.ObjList.doubleClicked.connect(self.__item_list_double_click)
+        self.RenameSig.connect(self.relabel)
         self.ButtonAdd.clicked.connect(self.__add_con)
         self.ButtonParent.clicked.connect(lambda: self.__send_options("Parent"))
         self.ButtonPoint.clicked.connect(lambda: self.__send_options("Point"))
@@ -511,11 +635,13 @@ class ConManWindow(QtWidgets.QMainWindow):
         self.ButtonScale.clicked.connect(lambda: self.__send_options("Scale"))
         self.ButtonRemove.clicked.connect(self.__remove_con)
         self.ButtonHelp.clicked.connect(self.show_help_ui)
+        self.ButtonScan.clicked.connect(self.__scan)
         self.ButtonPurge.clicked.connect(self.show_purge_ui)
         self.ButtonOff.clicked.connect(self.__switch_off)
         self.ButtonSwitch.clicked.connect(self.__switch_single)
         self.ButtonAll.clicked.connect(self.__switch_all)
-        self.ExistSig.connect(self.__stale_iter)
+        self.ButtonBake.clicked.connect(self.__bake)
+        self.ExistSig.connect(self.update_stale)
 
     def closeEvent(self, *args, **kwargs):
         """Custom closeEvent to write settings to file."""
@@ -535,38 +661,65 @@ class ConManWindow(QtWidgets.QMainWindow):
         self._Purge.ConfirmSig.connect(self.__purge)
 
     def iter_list(self):
-        """Return all instances of QListWidgetItem entries in constraint list."""
-        return [self.ObjList.item(i) for i in range(self.ObjList.count())]
+        """Return all ConEntry instances in the constraint list, including filtered ones."""
+        return self.ConModel.entries()
+
+    def entry_at(self, index):
+        """
+        ConEntry shown at a view index.
+
+        :param index: Index of the proxy model.
+        :return: ConEntry, or None for an invalid index.
+        """
+        if not index.isValid():
+            return None
+        return self.ConModel.entry(self.ConProxy.mapToSource(index).row())
 
     def __item_list_changed(self, current, previous):
-        if current is None:
+        entry = self.entry_at(current)
+        if entry is None:
             self.MenuSwitchTarget.clear()
         else:
-            log.debug("Clicked: {}".format(current.text()))
-            log.debug("Targets: {}".format(current.target))
-            self.populate_menu(current.target)
+            log.debug("Clicked: {}".format(entry.label))
+            log.debug("Targets: {}".format(entry.target))
+            self.populate_menu(entry.target)
 
-    def __item_list_double_click(self, item):
-        log.debug("Double clicked: {}".format(item.text()))
-        self.SelSig.emit(item.obj)
+    def __item_list_double_click(self, index):
+        entry = self.entry_at(index)
+        log.debug("Double clicked: {}".format(entry.label))
+        self.SelSig.emit(entry.obj)
 
-    def populate_list(self, data):
+    def populate_list(self, data_list):
         """
-        Create new QListWidgetItem instance with given data and sort list.
+        Add constraint entries with given data in a single insert.
 
-        :param data: Dict of vital constraint data for use in the UI.
+        :param data_list: List of dicts of vital constraint data for use in the UI.
         """
-        listItem = QListItemCon(data)
-        self.RenameSig.connect(listItem.update_label_callback)
-        self.ObjList.addItem(listItem)
-        self.ObjList.sortItems(order=QtCore.Qt.AscendingOrder)
-        self.ObjList.setCurrentItem(listItem)
+        entries = [ConEntry(data) for data in data_list]
+        for entry, data in zip(entries, data_list):
+            for uuid, handle in data.get("handles", ()):
+                self.__Index.setdefault(uuid, []).append((handle, entry))
+        self.ConModel.add_entries(entries)
+        if entries:
+            self.set_current_entry(entries[-1])
+
+    def set_current_entry(self, entry):
+        """
+        Make an entry the current one, if the filter shows it.
+
+        :param entry: ConEntry.
+        """
+        row = self.ConModel.entries().index(entry)
+        index = self.ConProxy.mapFromSource(self.ConModel.index(row))
+        if index.isValid():
+            self.ObjList.setCurrentIndex(index)
 
     def clear_list(self, arg=None):
         """Clear constraint list and all data stored in the UI."""
         log.debug("Clearing list")
-        self.ObjList.clear()
-        del self.__StaleData[:]
+        self.ConModel.clear()
+        self.__StaleData.clear()
+        self.__Index.clear()
 
     def populate_menu(self, selObjs):
         """
@@ -580,43 +733,57 @@ class ConManWindow(QtWidgets.QMainWindow):
             self.MenuSwitchTarget.setItemData(ind, str(item), userData=item)
             log.debug("Target {}: {}".format(ind, str(item)))
 
+    def selected_entries(self):
+        """
+        Constraint data of all selected list entries, in list order.
+
+        :return: List of (constraint node, constrained object, targets).
+        """
+        indexes = self.ObjList.selectionModel().selectedRows()
+        if not indexes and self.ObjList.currentIndex().isValid():
+            indexes = [self.ObjList.currentIndex()]
+        indexes.sort(key=lambda index: index.row())
+        return [index.data(QtCore.Qt.UserRole) for index in indexes]
+
     def __switch_off(self):
-        con_node, obj, targets = self.ObjList.currentItem().data(QtCore.Qt.UserRole)
+        entries = self.selected_entries()
 
-        log.debug("Con: {}".format(con_node))
-        log.debug("Obj: {}".format(obj))
+        log.debug("Entries: {}".format(entries))
 
         self.SwitchOffSig.emit(
-            (self.CheckVisTrans.isChecked(), self.CheckKey.isChecked(),
-             con_node, obj, targets)
+            (self.CheckVisTrans.isChecked(), self.CheckKey.isChecked(), entries)
         )
 
     def __switch_single(self):
-        con_node, obj, targets = self.ObjList.currentItem().data(QtCore.Qt.UserRole)
+        entries = self.selected_entries()
 
         current_index = self.MenuSwitchTarget.currentIndex()
         tgt_node = self.MenuSwitchTarget.itemData(current_index)
 
-        log.debug("Obj: {}".format(obj))
-        log.debug("Con: {}".format(con_node))
+        log.debug("Entries: {}".format(entries))
         log.debug("Target: {}".format(tgt_node))
 
         self.SwitchSingleSig.emit(
             (self.CheckVisTrans.isChecked(), self.CheckKey.isChecked(),
-             con_node, obj, targets, tgt_node)
+             entries, tgt_node, current_index)
         )
 
     def __switch_all(self):
-        con_node, obj, targets = self.ObjList.currentItem().data(QtCore.Qt.UserRole)
+        entries = self.selected_entries()
 
-        log.debug("Con: {}".format(con_node))
-        log.debug("Obj: {}".format(obj))
+        log.debug("Entries: {}".format(entries))
 
         self.SwitchAllSig.emit(
-            (self.CheckVisTrans.isChecked(), self.CheckKey.isChecked(),
-             con_node, obj, targets)
+            (self.CheckVisTrans.isChecked(), self.CheckKey.isChecked(), entries)
         )
 
+    def __bake(self):
+        entries = self.selected_entries()
+
+        log.debug("Entries: {}".format(entries))
+
+        self.BakeSig.emit(entries)
+
     def __send_options(self, conType):
         skipT = []
         skipR = []
@@ -678,37 +845,93 @@ class ConManWindow(QtWidgets.QMainWindow):
         self.AddSig.emit()
 
     def __remove_con(self, arg=None):
-        current_row = self.ObjList.currentRow()
-        current_item = self.ObjList.item(current_row)
-        log.debug("Removing {} from list...".format(current_item.label))
-        self.DelSig.emit(current_item.con_node)
-        # Callback will iter through UI after node deletion
-        log.debug("Removed {}...".format(current_item.label))
+        current_entry = self.entry_at(self.ObjList.currentIndex())
+        if current_entry is None:
+            return
+        log.debug("Removing {} from list...".format(current_entry.label))
+        self.DelSig.emit(current_entry.con_node)
+        # Callback will update the list after node deletion
+        log.debug("Removed {}...".format(current_entry.label))
+
+    def __scan(self):
+        namespace, ok = QtWidgets.QInputDialog.getText(
+            self, "Scan Scene", "Namespace (leave empty for the whole scene):")
+        if ok:
+            log.debug("Scanning namespace: {}".format(namespace))
+            self.ScanSig.emit(namespace)
 
     def __purge(self):
         log.debug("Purging")
         self.PurgeSig.emit()
         self._Purge = None
-        del self.__StaleData[:]
+        self.__StaleData.clear()
+        self.__Index.clear()
+
+    def is_indexed(self, uuid):
+        """
+        Test if a node may belong to a list entry.
+
+        :param uuid: UUID string of the node.
+        """
+        return uuid in self.__Index
+
+    def indexed_entries(self, nodes):
+        """
+        Entries that belong to nodes.
 
-    def __stale_iter(self, cb_bundle):
-        dag_path, clientData = cb_bundle
+        :param nodes: List of (UUID string, MObjectHandle).
+        :return: Set of ConEntry.
+        """
+        entries = set()
+        for uuid, handle in nodes:
+            for entry_handle, entry in self.__Index.get(uuid, ()):
+                if entry_handle == handle:
+                    entries.add(entry)
+        return entries
+
+    @QtCore.Slot(object)
+    def relabel(self, nodes):
+        """
+        Update labels and target menu of entries whose nodes were renamed.
 
-        if clientData:
-            for stale_item in self.__StaleData:
-                if stale_item.exists:
-                    self.RenameSig.connect(stale_item.update_label_callback)
-                    self.ObjList.addItem(stale_item)
-                    self.ObjList.sortItems(order=QtCore.Qt.AscendingOrder)
-                    self.ObjList.setCurrentItem(stale_item)
+        :param nodes: List of (UUID string, MObjectHandle) of renamed nodes.
+        """
+        entries = self.indexed_entries(nodes)
+        self.ConModel.reset_labels(entries)
+        current = self.entry_at(self.ObjList.currentIndex())
+        if current in entries:
+            target_index = self.MenuSwitchTarget.currentIndex()
+            self.populate_menu(current.target)
+            self.MenuSwitchTarget.setCurrentIndex(target_index)
 
-        elif clientData is False:
-            for list_item in self.iter_list():
-                if dag_path in [list_item.con_dag, list_item.object_dag]:
-                    current_row = self.ObjList.row(list_item)
-                    self.RenameSig.disconnect(list_item.update_label_callback)
-                    self.__StaleData.append(self.ObjList.takeItem(current_row))
-                    self.ObjList.sortItems(order=QtCore.Qt.AscendingOrder)
+    @QtCore.Slot(object)
+    def update_stale(self, nodes=None):
+        """
+        Move entries whose nodes were deleted out of the list, and restored ones back in.
+
+        StaleSig is emitted with the removed and restored entries.
+
+        :param nodes: List of (UUID string, MObjectHandle) of nodes that were added or removed.
+                      All entries are checked if None.
+        """
+        if nodes is None:
+            items = set(self.iter_list()) | self.__StaleData
+        else:
+            items = self.indexed_entries(nodes)
+
+        restored, removed = [], []
+        for item in items:
+            exists = item.exists
+            if exists and item in self.__StaleData:
+                self.__StaleData.discard(item)
+                restored.append(item)
+            elif not exists and item not in self.__StaleData:
+                self.__StaleData.add(item)
+                removed.append(item)
+        self.ConModel.remove_entries(removed)
+        self.ConModel.add_entries(restored)
+        if removed or restored:
+            self.StaleSig.emit(removed, restored)
 
 
 class PurgeConfirm(QtWidgets.QMainWindow):
@@ -873,6 +1096,6 @@ if __name__ == "__main__":
         win = QtCore.QCoreApplication.instance()
     _CMan = ConManWindow()
     _CMan.show()
-    _CMan.populate_list(generic_data)
+    _CMan.populate_list([generic_data])
 
     win.exec_()
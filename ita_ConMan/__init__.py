@@ -35,8 +35,9 @@ __license__ = "Apache 2.0"
 
 
 import os
-import pickle
-import base64
+import bisect
+import numpy
+from collections import OrderedDict
 import pymel.core as pmc
 import maya.cmds as cmds
 import maya.api.OpenMaya as om
@@ -44,6 +45,8 @@ from itertools import izip
 from utils.qtshim import QtCore, logging
 from utils.mayautils import get_maya_window, UndoChunk
 from ConManUI import ConManWindow
+from scenedata import DATA_KEY, encode_tracked, decode_tracked
+import matrices
 
 
 LogPath = os.path.dirname(__file__)
@@ -57,7 +60,21 @@ log.setLevel(logging.WARN)
 # Global Data =================================================================
 
 _CMan = None
+CON_TYPES = (
+    pmc.nodetypes.ParentConstraint,
+    pmc.nodetypes.PointConstraint,
+    pmc.nodetypes.OrientConstraint,
+    pmc.nodetypes.ScaleConstraint
+)
 callback_list = []
+_ConRecords = {}
+_ConWatch = {}
+_Tracked = OrderedDict()
+_TrackedData = ""
+_PendingNodes = []
+_RenamedNodes = []
+_NameWatch = {}
+_Suspended = set()
 
 
 # Add, Remove, Select Constraints =============================================
@@ -102,7 +119,7 @@ def create_con(conType, Offset, mOffset, weight, skipT, skipR, skipS):
                 "target": sel_objs,
                 "con_node": conObj
             }
-            _CMan.populate_list(con_data)
+            track_con(con_data)
 
     else:
         log.error("Select two or more objects to create a constraint")
@@ -111,17 +128,11 @@ def create_con(conType, Offset, mOffset, weight, skipT, skipR, skipS):
 @QtCore.Slot()
 def add_con():
     """Save existing constraint and its data."""
-    con_types = (
-        pmc.nodetypes.ParentConstraint,
-        pmc.nodetypes.PointConstraint,
-        pmc.nodetypes.OrientConstraint,
-        pmc.nodetypes.ScaleConstraint
-    )
+    con_nodes = []
     for obj in pmc.ls(sl=True):
         log.debug("Selected node: {}".format(str(obj)))
-        if type(obj) in con_types:
-            con_data = get_data(obj)
-            _CMan.populate_list(con_data)
+        if type(obj) in CON_TYPES:
+            con_nodes.append(obj)
 
         else:
             log.warning(
@@ -130,6 +141,14 @@ def add_con():
                 "constraint to add it the tracker."
             )
 
+    data_list = []
+    for con_node, con_data in izip(con_nodes, get_data_list(con_nodes)):
+        if con_data is None:
+            log.warning("Constraint drives nothing: {}".format(con_node))
+        else:
+            data_list.append(con_data)
+    track_cons(data_list)
+
 
 @QtCore.Slot()
 def remove_con(con_node):
@@ -200,112 +219,195 @@ def sel_con_node(node):
     log.debug("Selected: {}".format(node))
 
 
-# Switch Weight ===============================================================
+# Connection Records ==========================================================
 
+def get_record(con_node):
+    """
+    Get the cached connection record of a constraint, building it if needed.
 
-@QtCore.Slot()
-def switch_single(con_tup):
+    :param con_node: Constraint PyNode.
+    :return: Record dict, see build_record.
     """
-    Switch constraint weight to a single defined target.
+    record = _ConRecords.get(con_node)
+    if record is None:
+        record = build_record(con_node)
+        _ConRecords[con_node] = record
+        watch_record(con_node)
+    return record
+
 
-    :param con_tup: Tuple of UI options and constraint node, targets and object.
+def build_record(con_node):
     """
-    log.debug("Switching single...")
-    MVis, Key, con_node, obj, targets, sel_tgt = con_tup
+    Collect a constraint's connections in one traversal.
 
-    log.debug(con_tup)
+    :param con_node: Constraint PyNode.
+    :return: Record dict, see build_records.
+    """
+    return build_records([con_node])[con_node]
 
-    attr_list = get_connected_attr(con_node, obj)
-    weight_list = get_weight_attr(con_node)
-    offset_list = get_offset_attr(con_node)
-    obj_mat = obj.getMatrix(worldSpace=True)
 
-    log.debug("Attr list: {}".format(attr_list))
-    log.debug("Weight list: {}".format(weight_list))
-    log.debug("Offset list: {}".format(offset_list))
+def build_records(con_nodes):
+    """
+    Collect the connections of many constraints with one query per kind of connection.
 
-    with UndoChunk():
-        if not MVis and not Key:
-            try:
-                # Blend attr
-                get_blend_attr(con_node).set(1)
-            except:
-                pass
-
-            # Weight attr
-            for tgt in con_node.getTargetList():
-                log.debug("Target: {}".format(tgt))
-                con_node.setWeight(1, tgt) if tgt == sel_tgt else con_node.setWeight(0, tgt)
+    :param con_nodes: Constraint PyNodes.
+    :return: Dict of constraint to record. Records are dicts of targets, weight attributes,
+             offset attributes, pairBlend nodes, blend attribute (or None), driven attributes
+             and the constrained object (or None).
+    """
+    records = OrderedDict()
+    for con_node in con_nodes:
+        records[con_node] = {
+            "targets": {}, "weights": {}, "offsets": [], "pair_blends": [],
+            "blend": None, "driven": [], "object": None}
+    if not records:
+        return records
+
+    # Driven attributes, directly or through pairBlends
+    owners = {}
+    for src, dst in pmc.listConnections(
+            list(records), source=False, destination=True, plugs=True, connections=True):
+        record = records[src.node()]
+        node = dst.node()
+        if isinstance(node, pmc.nodetypes.PairBlend):
+            if node not in owners:
+                owners[node] = record
+                record["pair_blends"].append(node)
+        elif node not in records:
+            record["driven"].append(dst)
+    if owners:
+        for src, dst in pmc.listConnections(
+                list(owners), source=False, destination=True, plugs=True, connections=True):
+            owners[src.node()]["driven"].append(dst)
+        for dst, src in pmc.listConnections(
+                [node.weight for node in owners], source=True, destination=False,
+                plugs=True, connections=True):
+            record = owners[dst.node()]
+            if record["blend"] is None and record["pair_blends"][0] == dst.node():
+                record["blend"] = src
+
+    # Targets and weights, by target index
+    for dst, src in pmc.listConnections(
+            [con_node.target for con_node in records], source=True, destination=False,
+            plugs=True, connections=True):
+        record = records[dst.node()]
+        name = dst.longName()
+        if name.endswith("targetParentMatrix"):
+            record["targets"][dst.parent().index()] = src.node()
+        elif name.endswith("targetWeight"):
+            record["weights"][dst.parent().index()] = src
+
+    for con_node, record in records.items():
+        indices = sorted(record["targets"])
+        record["targets"] = [record["targets"][ind] for ind in indices]
+        record["weights"] = [record["weights"][ind] for ind in indices if ind in record["weights"]]
+        if isinstance(con_node, pmc.nodetypes.ParentConstraint):
+            for ind in indices:
+                record["offsets"].append(pmc.PyNode(con_node.tg[ind].targetOffsetTranslate))
+                record["offsets"].append(pmc.PyNode(con_node.tg[ind].targetOffsetRotate))
+        else:
+            record["offsets"].append(pmc.PyNode(con_node.offset))
+        if record["driven"]:
+            record["object"] = record["driven"][0].node()
+    return records
 
-        elif MVis and not Key:
-            try:
-                # Blend attr
-                get_blend_attr(con_node).set(1)
-            except:
-                pass
 
-            # Weight attr
-            for tgt in con_node.getTargetList():
-                log.debug("Target: {}".format(tgt))
-                con_node.setWeight(1, tgt) if tgt == sel_tgt else con_node.setWeight(0, tgt)
+def load_records(con_nodes):
+    """
+    Build and watch the records of all constraints that have none yet, in one pass.
 
-            # Update offset
-            obj.setMatrix(obj_mat, worldSpace=True)
-            update_offset(con_node, targets)
-
-        elif MVis and Key:
-            # Weight attr
-            for attr, pynode in izip(weight_list, con_node.getTargetList()):
-                if pynode == sel_tgt:
-                    con_node.setWeight(1, pynode)
-                    key_attr(attr, new_value=1, copy_previous=True)
-                else:
-                    con_node.setWeight(0, pynode)
-                    key_attr(attr, new_value=0, copy_previous=True)
-
-            obj.setMatrix(obj_mat, worldSpace=True)
-            # Key constrained attributes
-            for attr in attr_list:
-                log.debug("Attr: {}".format(attr))
-                key_attr(attr)
-            # Update offset
-            update_offset(con_node, targets)
-
-            # Key offsets
-            for attr in offset_list:
-                log.debug("Offset: {}".format(attr))
-                key_attr(attr, copy_previous=True)
-
-            try:
-                # Blend attr
-                blend_attr = get_blend_attr(con_node)
-                blend_attr.set(1)
-                key_attr(blend_attr, new_value=1, copy_previous=True)
-            except:
-                pass
-
-        elif not MVis and Key:
-            # Weight attr
-            for attr, pynode in izip(weight_list, con_node.getTargetList()):
-                if pynode == sel_tgt:
-                    con_node.setWeight(1, pynode)
-                    key_attr(attr, new_value=1, copy_previous=True)
-                else:
-                    con_node.setWeight(0, pynode)
-                    key_attr(attr, new_value=0, copy_previous=True)
+    :param con_nodes: Constraint PyNodes.
+    :return: List of records, in the order of con_nodes.
+    """
+    missing = [con_node for con_node in con_nodes if con_node not in _ConRecords]
+    for con_node, record in build_records(missing).items():
+        _ConRecords[con_node] = record
+        watch_record(con_node)
+    return [_ConRecords[con_node] for con_node in con_nodes]
 
-            # Key constrained attributes
-            for attr in attr_list:
-                log.debug("Attr: {}".format(attr))
-                key_attr(attr)
 
-            try:
-                # Blend attr
-                blend_attr = get_blend_attr(con_node)
-                blend_attr.set(1)
-                key_attr(blend_attr, new_value=1, copy_previous=True)
-            except:
-                pass
+def watch_record(con_node):
+    """
+    Drop the constraint's record whenever its connections change.
+
+    :param con_node: Constraint PyNode.
+    """
+    sel = om.MSelectionList()
+    sel.add(con_node.name())
+    mobj = sel.getDependNode(0)
+    key = om.MObjectHandle(mobj).hashCode()
+    if key not in _ConWatch:
+        _ConWatch[key] = om.MNodeMessage.addAttributeChangedCallback(mobj, connection_cb, con_node)
+
+
+def drop_record(con_node, handle):
+    """
+    Drop a constraint's record and stop watching its connections.
+
+    :param con_node: Constraint PyNode.
+    :param handle: MObjectHandle of the constraint node.
+    """
+    callback = _ConWatch.pop(handle.hashCode(), None)
+    if callback is not None:
+        try:
+            om.MMessage.removeCallback(callback)
+        except RuntimeError:
+            log.debug("Callback already removed: {}".format(con_node))
+    _ConRecords.pop(con_node, None)
+
+
+def connection_cb(msg, plug, other_plug, clientData=None):
+    """
+    Callback to invalidate a connection record.
+
+    :param msg: Attribute change message.
+    :param clientData: Constraint PyNode the record belongs to.
+    """
+    if msg & (om.MNodeMessage.kConnectionMade | om.MNodeMessage.kConnectionBroken):
+        _ConRecords.pop(clientData, None)
+
+
+def clear_records(arg=None):
+    """Drop all connection records and their callbacks."""
+    if _ConWatch:
+        om.MMessage.removeCallbacks(list(_ConWatch.values()))
+    _ConWatch.clear()
+    _ConRecords.clear()
+
+
+# Switch Weight ===============================================================
+
+
+@QtCore.Slot()
+def switch_single(con_tup):
+    """
+    Switch constraint weights to a single defined target.
+
+    Each constraint switches to the selected target if it has it,
+    otherwise to its target at the same index in its target list.
+
+    :param con_tup: Tuple of UI options, list of (constraint node, object, targets), target node and index.
+    """
+    log.debug("Switching single...")
+    MVis, Key, entries, sel_tgt, sel_index = con_tup
+
+    log.debug(con_tup)
+
+    chosen = []
+    weights = []
+    for entry in entries:
+        targets = get_record(entry[0])["targets"]
+        if sel_tgt in targets:
+            tgt = sel_tgt
+        elif 0 <= sel_index < len(targets):
+            tgt = targets[sel_index]
+        else:
+            log.warning("{} has no target to switch to".format(entry[0]))
+            continue
+        chosen.append(entry)
+        weights.append([1 if t == tgt else 0 for t in targets])
+
+    _do_switch(MVis, Key, chosen, weights, 1, copy_driven=False, copy_offsets=True)
 
 
 @QtCore.Slot()
@@ -326,91 +428,259 @@ def _do_switch_on_off(con_tup, val):
     """
     Switch weight fully on or off.
 
-    :param con_tup: Tuple of UI options and constraint node, targets and object.
+    :param con_tup: Tuple of UI options and list of (constraint node, object, targets).
     :param val: Value to set weights to. Should be 0 or 1.
     """
-    MVis, Key, con_node, obj, targets = con_tup
+    MVis, Key, entries = con_tup
 
     log.debug(con_tup)
 
-    attr_list = get_connected_attr(con_node, obj)
-    weight_list = get_weight_attr(con_node)
-    offset_list = get_offset_attr(con_node)
-    obj_mat = obj.getMatrix(worldSpace=True)
+    weights = [[val] * len(get_record(entry[0])["targets"]) for entry in entries]
+    _do_switch(MVis, Key, entries, weights, val, copy_driven=True, copy_offsets=False)
+
 
-    log.debug("Attr list: {}".format(attr_list))
-    log.debug("Weight list: {}".format(weight_list))
-    log.debug("Offset list: {}".format(offset_list))
+def _do_switch(MVis, Key, entries, weights, blend_val, copy_driven, copy_offsets):
+    """
+    Switch weights of many constraints in one undo chunk.
+
+    Each step runs over all constraints before the next one. World matrices
+    are captured before any weight changes, so constrained objects that
+    depend on each other keep their place.
+
+    :param MVis: Maintain visual transforms by updating offsets.
+    :param Key: Key weights, constrained attributes, offsets and blend attributes.
+    :param entries: List of (constraint node, constrained object, targets).
+    :param weights: List of weight values per target of each constraint.
+    :param blend_val: Value to set pairBlend blend attributes to.
+    :param copy_driven: Copy previous keys of constrained attributes when not maintaining visual transforms.
+    :param copy_offsets: Copy previous keys of offsets.
+    """
+    records = [get_record(con_node) for con_node, obj, targets in entries]
+    world_mats = [obj.getMatrix(worldSpace=True) for con_node, obj, targets in entries]
+
+    for record in records:
+        log.debug("Attr list: {}".format(record["driven"]))
+        log.debug("Weight list: {}".format(record["weights"]))
+        log.debug("Offset list: {}".format(record["offsets"]))
 
+    batch = KeyBatch()
     with UndoChunk():
-        if not MVis and not Key:
-            try:
-                # Blend attr
-                get_blend_attr(con_node).set(val)
-            except:
-                pass
-
-            # Weight attr
-            for tgt in con_node.getTargetList():
+        # Weight attr
+        for (con_node, obj, targets), record, values in izip(entries, records, weights):
+            for attr, tgt, val in izip(record["weights"], record["targets"], values):
+                log.debug("Target: {}".format(tgt))
                 con_node.setWeight(val, tgt)
+                if Key:
+                    key_attr(attr, new_value=val, copy_previous=True, batch=batch)
 
-        elif MVis and not Key:
-            try:
-                # Blend attr
-                get_blend_attr(con_node).set(val)
-            except:
-                pass
+        if MVis:
+            for (con_node, obj, targets), obj_mat in izip(entries, world_mats):
+                obj.setMatrix(obj_mat, worldSpace=True)
 
-            # Weight attr
-            for tgt in con_node.getTargetList():
-                con_node.setWeight(val, tgt)
+        if Key:
+            # Key constrained attributes
+            for record in records:
+                for attr in record["driven"]:
+                    log.debug("Attr: {}".format(attr))
+                    key_attr(attr, copy_previous=copy_driven and not MVis, batch=batch)
 
+        if MVis:
             # Update offset
-            obj.setMatrix(obj_mat, worldSpace=True)
-            update_offset(con_node, targets)
+            for con_node, obj, targets in entries:
+                update_offset(con_node, targets)
 
-        elif MVis and Key:
-            # Weight attr
-            for attr, pynode in izip(weight_list, con_node.getTargetList()):
-                con_node.setWeight(val, pynode)
-                key_attr(attr, new_value=val, copy_previous=True)
+            if Key:
+                # Key offsets
+                for record in records:
+                    for attr in record["offsets"]:
+                        log.debug("Offset: {}".format(attr))
+                        key_attr(attr, copy_previous=copy_offsets, batch=batch)
 
-            obj.setMatrix(obj_mat, worldSpace=True)
-            # Key constrained attributes
-            for attr in attr_list:
-                key_attr(attr)
-            # Update offset
-            update_offset(con_node, targets)
-
-            # Key offsets
-            for attr in offset_list:
-                key_attr(attr)
-
-            try:
-                # Blend attr
-                blend_attr = get_blend_attr(con_node)
-                blend_attr.set(val)
-                key_attr(blend_attr, new_value=val, copy_previous=True)
-            except:
-                pass
-
-        elif not MVis and Key:
-            # Weight attr
-            for attr, pynode in izip(weight_list, con_node.getTargetList()):
-                con_node.setWeight(val, pynode)
-                key_attr(attr, new_value=val, copy_previous=True)
+        # Live values are keyed before blending changes them
+        batch.write()
 
-            # Key constrained attributes
-            for attr in attr_list:
-                key_attr(attr, copy_previous=True)
+        # Blend attr, looked up again as keying may have added a pairBlend
+        for con_node, obj, targets in entries:
+            blend_attr = get_blend_attr(con_node)
+            if blend_attr is None:
+                continue
+            blend_attr.set(blend_val)
+            if Key:
+                key_attr(blend_attr, new_value=blend_val, copy_previous=True, batch=batch)
+        batch.write()
+
+
+# Switch Schedule =============================================================
+
+def offset_matrix(translate, rotate):
+    """
+    Parent constraint offset as a matrix.
+
+    :param translate: Target offset translate.
+    :param rotate: Target offset rotate in degrees.
+    :return: 4x4 Numpy array.
+    """
+    mat = numpy.eye(4)
+    mat[:3, :3] = matrices.rotation_matrices(numpy.radians(rotate))
+    mat[3, :3] = translate
+    return mat
+
+
+def switch_schedule(con_node, obj, events, maintain=True):
+    """
+    Key a series of single-target switches on one constraint in one pass.
+
+    Each event switches weights over the frame before it, like a keyed
+    "SWITCH". With maintain, offsets that keep the object in place are
+    chained from target world matrices sampled at all event frames at once.
+    Offsets are exact for parent constraints and translation-only for point
+    constraints. Orient and scale constraints only get their weights keyed.
+    Targets are assumed to have their rotate pivots at their origin.
+
+    ita_ConMan.switch_schedule(con_node, obj, [(10, "hand_L"), (42, "world"), (60, "hand_R")])
+
+    :param con_node: Constraint PyNode.
+    :param obj: Constrained object PyNode.
+    :param events: List of (frame, target) tuples; targets as PyNodes or names.
+    :param maintain: Key offsets to maintain visual transforms.
+    """
+    record = get_record(con_node)
+    targets = record["targets"]
+    events = sorted((float(frame), pmc.PyNode(tgt)) for frame, tgt in events)
+    missing = [tgt for frame, tgt in events if tgt not in targets]
+    if missing:
+        log.error("Not targets of {}: {}".format(con_node, missing))
+        return
+    if not events:
+        return
+
+    frames = numpy.array([frame for frame, tgt in events])
+    chosen = [targets.index(tgt) for frame, tgt in events]
+    weight_plugs = [str(attr) for attr in record["weights"]]
+
+    first = frames[0] - 1
+    weights = numpy.array([cmds.getAttr(plug, time=first) for plug in weight_plugs])
+    active = int(numpy.argmax(weights))
+
+    batch = KeyBatch()
+    for frame, new in izip(frames.tolist(), chosen):
+        for ind, plug in enumerate(weight_plugs):
+            batch.add_key(plug, frame - 1, float(weights[ind]))
+            batch.add_key(plug, frame, 1.0 if ind == new else 0.0)
+        weights = numpy.eye(len(targets))[new]
+
+    is_parent = isinstance(con_node, pmc.nodetypes.ParentConstraint)
+    is_point = isinstance(con_node, pmc.nodetypes.PointConstraint)
+    if maintain and not (is_parent or is_point):
+        log.warning("Offsets are not maintained for {} constraints".format(get_con_type(con_node)))
+    elif maintain:
+        plugs = ["{}.worldMatrix[0]".format(tgt.longName()) for tgt in targets]
+        plugs.append("{}.parentInverseMatrix[0]".format(obj.longName()))
+        sampled = matrices.sample_matrices(plugs, frames)
+        inverse = numpy.linalg.inv(sampled[:-1])
+
+        if is_parent:
+            # Offset * target world stays the same across each switch.
+            # Stepped keys hold each target's offset while it is active.
+            def key_offset(ind, time, offset):
+                translate, rotate, scale = matrices.decompose(offset)
+                for attr, values in (("targetOffsetTranslate", translate), ("targetOffsetRotate", rotate)):
+                    for axis, value in izip("XYZ", values.tolist()):
+                        plug = "{}.tg[{}].{}{}".format(con_node, ind, attr, axis)
+                        batch.add_key(plug, time, value, out_type="step")
+
+            ot = str(con_node.tg[active].targetOffsetTranslate)
+            orot = str(con_node.tg[active].targetOffsetRotate)
+            offset = offset_matrix(cmds.getAttr(ot, time=first)[0], cmds.getAttr(orot, time=first)[0])
+            for e, new in enumerate(chosen):
+                key_offset(active, frames[e], offset)
+                offset = numpy.matmul(numpy.matmul(offset, sampled[active, e]), inverse[new, e])
+                key_offset(new, frames[e] - 1, offset)
+                active = new
+        else:
+            # Offset makes up the distance between targets, in the object's parent space
+            offset = numpy.array(cmds.getAttr(str(con_node.offset), time=first)[0])
+            for e, new in enumerate(chosen):
+                positions = numpy.matmul(sampled[[active, new], e, 3, :], sampled[-1, e])
+                previous = offset
+                offset = offset + positions[0, :3] - positions[1, :3]
+                for axis, old_value, value in izip("XYZ", previous.tolist(), offset.tolist()):
+                    plug = "{}.offset{}".format(con_node, axis)
+                    batch.add_key(plug, frames[e] - 1, old_value, out_type="step")
+                    batch.add_key(plug, frames[e], value, out_type="step")
+                active = new
 
-            try:
-                # Blend attr
-                blend_attr = get_blend_attr(con_node)
-                blend_attr.set(val)
-                key_attr(blend_attr, new_value=val, copy_previous=True)
-            except:
-                pass
+    with UndoChunk():
+        batch.write()
+
+
+# Bake ========================================================================
+
+@QtCore.Slot()
+def bake_con(entries):
+    """
+    Bake constrained objects to keys over the playback range and delete their constraints.
+
+    World and parent matrices of all objects are sampled for every frame in
+    one pass, decomposed with NumPy, and written with one setAttr per channel.
+
+    :param entries: List of (constraint node, constrained object, targets).
+    """
+    log.debug("Baking...")
+    start = cmds.playbackOptions(q=True, min=True)
+    end = cmds.playbackOptions(q=True, max=True)
+    frames = numpy.arange(start, end + 1.0)
+
+    records = [get_record(con_node) for con_node, obj, targets in entries]
+    plugs = []
+    for con_node, obj, targets in entries:
+        plugs.extend([
+            "{}.worldMatrix[0]".format(obj.longName()),
+            "{}.parentInverseMatrix[0]".format(obj.longName())])
+    sampled = matrices.sample_matrices(plugs, frames)
+
+    with UndoChunk():
+        for n, ((con_node, obj, targets), record) in enumerate(izip(entries, records)):
+            node = obj.longName()
+            local = numpy.matmul(sampled[2 * n], sampled[2 * n + 1])
+            translate, rotate, scale = matrices.decompose(local, **matrices.transform_attrs(node))
+            channels = {
+                "translate": translate,
+                "rotate": matrices.unwrap_degrees(rotate, cmds.getAttr(node + ".rotate")[0]),
+                "scale": scale,
+            }
+            driven = [
+                attr.attrName(longName=True) for attr in record["driven"]
+                if attr.node() == obj and attr.attrName(longName=True) in matrices.CHANNELS
+            ]
+
+            # Animation blended with the constraint is replaced by the bake
+            old_curves = []
+            for node_pb in record["pair_blends"]:
+                old_curves.extend(cmds.listConnections(
+                    node_pb.name(), source=True, destination=False, type="animCurve") or [])
+            blend = None
+            if record["blend"] is not None and record["blend"].node() == obj:
+                blend = "{}.{}".format(node, record["blend"].attrName(longName=True))
+            pmc.delete(record["pair_blends"] + [con_node])
+            if old_curves:
+                cmds.delete(old_curves)
+
+            # Blend attribute the constraint added to the object, once nothing reads it
+            if (blend is not None and
+                    blend.split(".")[-1] in (cmds.listAttr(node, userDefined=True) or []) and
+                    not cmds.listConnections(blend, source=False, destination=True)):
+                blend_curves = cmds.listConnections(
+                    blend, source=True, destination=False, type="animCurve")
+                if blend_curves:
+                    cmds.delete(blend_curves)
+                cmds.deleteAttr(blend)
+
+            for attr in driven:
+                vector, axis, curve_type = matrices.CHANNELS[attr]
+                matrices.write_curve(
+                    "{}.{}".format(node, attr), frames, channels[vector][:, axis], curve_type)
+            log.info("Baked {} channels of {}".format(len(driven), node))
 
 
 def get_blend_attr(con_node):
@@ -418,13 +688,10 @@ def get_blend_attr(con_node):
     Get blend attribute on the object.
 
     :param con_node: Constraint PyNode.
-    :return: Blend Attribute() object.
+    :return: Blend Attribute() object, or None without a pairBlend.
     :rtype: Attribute() object.
     """
-    node_connections = set(pmc.listConnections(con_node, source=False, destination=True))
-    for node in node_connections:
-        if isinstance(node, pmc.nodetypes.PairBlend):
-            return node.weight.inputs(source=True, destination=False, plugs=True)[0]
+    return get_record(con_node)["blend"]
 
 
 def get_connected_attr(con_node, obj):
@@ -436,13 +703,7 @@ def get_connected_attr(con_node, obj):
     :return: Attributes connected to the constraint.
     :rtype: List of Attribute() objects.
     """
-    node_connections = set(pmc.listConnections(con_node, source=False, destination=True))
-    for node in node_connections:
-        if node == obj:
-            attr_list = pmc.listConnections(con_node, source=False, destination=True, plugs=True)
-        elif isinstance(node, pmc.nodetypes.PairBlend):
-            attr_list = pmc.listConnections(node, source=False, destination=True, plugs=True)
-    return attr_list
+    return get_record(con_node)["driven"]
 
 
 def get_weight_attr(con_node):
@@ -453,7 +714,7 @@ def get_weight_attr(con_node):
     :return: All constraint targets.
     :rtype: List of PyNode objects.
     """
-    return con_node.getWeightAliasList()
+    return get_record(con_node)["weights"]
 
 
 def get_offset_attr(con_node):
@@ -464,55 +725,146 @@ def get_offset_attr(con_node):
     :return: Constraint offset attributes.
     :rtype: List of Attribute() objects.
     """
-    attr_list = []
-    if isinstance(con_node, pmc.nodetypes.ParentConstraint):
-        for ind, tgt in enumerate(con_node.getTargetList()):
-            attr_list.append(pmc.PyNode(con_node.tg[ind].targetOffsetTranslate))
-            attr_list.append(pmc.PyNode(con_node.tg[ind].targetOffsetRotate))
-    else:
-        attr_list.append(pmc.PyNode(con_node.offset))
-    return attr_list
+    return get_record(con_node)["offsets"]
+
+
+class KeyBatch(object):
+
+    """
+    Keys for the previous and current frame, computed in memory and written together.
+
+    Keys holding the attribute's live value are written with one setKeyframe
+    per frame. Keys with explicit values are grouped by value and tangents,
+    which for weights and blend attributes is only a few calls. Copied keys
+    keep the tangent types, angles, weights and locks of their source key.
+    """
 
+    def __init__(self):
+        self.cur_time = pmc.currentTime(q=True)
+        self._live = OrderedDict()
+        self._explicit = OrderedDict()
+
+    def add(self, attr, new_value=None, copy_previous=None):
+        """
+        Add keys of an attribute on the previous and current frame.
+
+        :param attr: Attribute to be keyed of type Attribute().
+        :param new_value: Explicitly set key value on current frame.
+        :param copy_previous: Explicitly copy previous key or value onto previous frame for a single-frame switch.
+        """
+        plug = str(attr)
+        cur_time = self.cur_time
+
+        log.debug("Attr: {}".format(plug))
+        log.debug("New value: {}".format(new_value))
+        log.debug("Copy previous: {}".format(copy_previous))
+
+        prev_key = None
+        if copy_previous:
+            times = cmds.keyframe(plug, q=True, timeChange=True) or []
+            index = bisect.bisect_left(times, cur_time) - 1
+            if index >= 0:
+                key = (index, index)
+                prev_key = (
+                    cmds.keyframe(plug, q=True, index=key, valueChange=True)[0],
+                    cmds.keyTangent(plug, q=True, index=key, itt=True)[0],
+                    cmds.keyTangent(plug, q=True, index=key, ott=True)[0],
+                    self.tangents(plug, key),
+                )
+                log.debug("Previous key time: {}".format(times[index]))
+
+        if prev_key is None:
+            self._live.setdefault(cur_time - 1, []).append(plug)
+        else:
+            self._explicit.setdefault((cur_time - 1,) + prev_key, []).append(plug)
 
-def key_attr(attr, new_value=None, copy_previous=None):
+        if new_value is None:
+            self._live.setdefault(cur_time, []).append(plug)
+        else:
+            self._explicit.setdefault((cur_time, new_value, None, None, None), []).append(plug)
+
+    @staticmethod
+    def tangents(plug, index):
+        """
+        Query the angles, weights and locks of a key's tangents.
+
+        :param plug: Plug name.
+        :param index: Key index range, as (index, index).
+        :return: Tuple of (keyTangent flag, value). Weights are only included on weighted curves.
+        """
+        flags = ["inAngle", "outAngle", "lock"]
+        if cmds.keyTangent(plug, q=True, weightedTangents=True)[0]:
+            flags += ["inWeight", "outWeight", "weightLock"]
+        return tuple(
+            (flag, cmds.keyTangent(plug, q=True, index=index, **{flag: True})[0]) for flag in flags)
+
+    def add_key(self, plug, time, value, out_type=None):
+        """
+        Add a single key with an explicit value.
+
+        :param plug: Plug name.
+        :param time: Key time.
+        :param value: Key value.
+        :param out_type: Out tangent type, Maya's default if None.
+        """
+        self._explicit.setdefault((time, value, None, out_type, None), []).append(plug)
+
+    def write(self):
+        """Write and forget all collected keys."""
+        log.debug("Keying {} live and {} explicit groups...".format(len(self._live), len(self._explicit)))
+        for time, plugs in self._live.items():
+            cmds.setKeyframe(plugs, t=time)
+        for (time, value, in_type, out_type, tangents), plugs in self._explicit.items():
+            types = {}
+            if in_type:
+                types["itt"] = in_type
+            if out_type:
+                types["ott"] = out_type
+            cmds.setKeyframe(plugs, t=time, v=value, **types)
+            if tangents:
+                self.write_tangents(plugs, time, dict(tangents), types)
+        self._live.clear()
+        self._explicit.clear()
+
+    @staticmethod
+    def write_tangents(plugs, time, tangents, types):
+        """
+        Set the angles, weights and locks of keys, keeping their tangent types.
+
+        Tangents are unlocked while angles and weights are set, as setting
+        them on locked tangents moves both sides. Setting angles makes the
+        tangents fixed, so the types are set again afterwards.
+
+        :param plugs: Plug names.
+        :param time: Key time.
+        :param tangents: Dict of keyTangent flag to value, see tangents.
+        :param types: Dict of itt and ott tangent types.
+        """
+        locks = dict((flag, tangents.pop(flag)) for flag in ("lock", "weightLock") if flag in tangents)
+        cmds.keyTangent(plugs, e=True, time=(time, time), **dict((flag, False) for flag in locks))
+        cmds.keyTangent(plugs, e=True, time=(time, time), **tangents)
+        types.update(locks)
+        cmds.keyTangent(plugs, e=True, time=(time, time), **types)
+
+
+def key_attr(attr, new_value=None, copy_previous=None, batch=None):
     """
     Key given attr on previous and current frame.
 
+    The key clipboard is left untouched.
+
     :param attr: Attribute to be keyed of type Attribute().
     :param new_value: Explicitly set key value on current frame.
     :param copy_previous: Explicitly copy previous key or value onto previous frame for a single-frame switch.
+    :param batch: KeyBatch to add the keys to. Keys are written right away without one.
     """
     log.debug("Keying attr...")
-
-    cur_time = pmc.currentTime(q=True)
-
-    log.debug("Attr: {}".format(attr))
-    log.debug("New value: {}".format(new_value))
-    log.debug("Copy previous: {}".format(copy_previous))
-    log.debug("Current time: {}".format(cur_time))
-
-    if copy_previous:
-        prev_key_time = pmc.findKeyframe(attr, which="previous")
-        prev_key_value = attr.get(t=prev_key_time)
-        prev_key = pmc.copyKey(attr, t=prev_key_time)
-
-        log.debug("Previous key time: {}".format(prev_key_time))
-        log.debug("Previous key value: {}".format(prev_key_value))
-
-        # If a key did not exist
-        if prev_key == 0:
-            pmc.setKeyframe(attr, t=(cur_time - 1))
-        # If a key exists
-        elif prev_key == 1:
-            pmc.pasteKey(attr, t=(cur_time - 1))
-    else:
-        pmc.setKeyframe(attr, t=(cur_time - 1))
-
-    if new_value:
-        pmc.setKeyframe(attr, t=cur_time, v=new_value)
-        attr.set(new_value)
+    if batch is None:
+        batch = KeyBatch()
+        batch.add(attr, new_value, copy_previous)
+        batch.write()
     else:
-        pmc.setKeyframe(attr, t=cur_time)
+        batch.add(attr, new_value, copy_previous)
 
 
 def update_offset(con_node, targets):
@@ -534,23 +886,21 @@ def update_offset(con_node, targets):
 
 # Constraint Data =============================================================
 
-def get_object(con_node):
+def node_handles(nodes):
     """
-    Get constrained object. Skip over pairBlend nodes in the case of existing animation.
+    UUIDs and handles of nodes, to find list entries from callbacks.
 
-    :param con_node: Constraint PyNode.
-    :return: Constrained object.
+    :param nodes: PyNodes.
+    :return: List of (UUID string, MObjectHandle).
     """
-    obj_list = []
-
-    node_connections = set(pmc.listConnections(con_node, source=False, destination=True))
-    for node in node_connections:
-        if isinstance(node, pmc.nodetypes.PairBlend):
-            obj_list.extend(set(pmc.listConnections(node, source=False, destination=True)))
-        else:
-            obj_list.extend(set(pmc.listConnections(con_node, source=False, destination=True)))
-
-    return list(set(obj_list))[0]
+    sel = om.MSelectionList()
+    for node in nodes:
+        sel.add(node.longName())
+    result = []
+    for i in range(sel.length()):
+        mobj = sel.getDependNode(i)
+        result.append((om.MFnDependencyNode(mobj).uuid().asString(), om.MObjectHandle(mobj)))
+    return result
 
 
 def get_con_type(con_node):
@@ -579,74 +929,228 @@ def get_data(con_node):
     :param con_node: Constraint PyNode.
     :return: Data associated with the constraint: type, constrained object, targets, constraint node.
     """
-    con_data = {
-        "type": get_con_type(con_node),
-        "object": get_object(con_node),
-        "target": con_node.getTargetList(),
-        "con_node": con_node
-    }
-    return con_data
-
-
-# Pickle ======================================================================
-
-def pickle_read(arg=None):
-    """Read pickled data from scene's fileInfo attribute."""
-    log.info("Reading pickle...")
-
-    try:
-        _CMan.clear_list()
-        sceneInfo = pmc.fileInfo("CMan_data", q=True)
-
-        # Compatability check for Maya versions <2016
-        if isinstance(sceneInfo, list):
-            if sceneInfo != []:
-                for entry in sceneInfo:
-                    if entry[0] == "CMan_data":
-                        sceneInfo = entry[1]
-                        break
-            else:
-                # Fill in bogus data to satisfy b64decode and pickle
-                bogus = "a"
-                pickled = pickle.dumps(bogus)
-                sceneInfo = base64.b64encode(pickled)
-        # End compatability check
-
-        decoded = base64.b64decode(sceneInfo)
-        DagList = pickle.loads(decoded)
-
-        for dag in DagList:
-            try:
-                con_obj = pmc.ls(dag)[0]
-                con_data = get_data(con_obj)
-                _CMan.populate_list(con_data)
-            except:
-                log.debug("DAG path invalid: {}".format(dag))
-        log.info("Read pickle complete")
-
-    except KeyError:
-        log.info("No data found")
+    return get_data_list([con_node])[0]
 
 
-@QtCore.Slot()
-def pickle_write(arg=None):
-    """Write pickled data into scene's fileInfo attribute."""
-    log.info("Writing pickle...")
+def get_data_list(con_nodes):
+    """
+    Return constraint data of many constraints from one pass over their connections.
+
+    :param con_nodes: Constraint PyNodes.
+    :return: List of data dicts, see get_data. Constraints that drive nothing are None.
+    """
+    result = []
+    for con_node, record in izip(con_nodes, load_records(con_nodes)):
+        if record["object"] is None:
+            result.append(None)
+            continue
+        result.append({
+            "type": get_con_type(con_node),
+            "object": record["object"],
+            "target": record["targets"],
+            "con_node": con_node,
+            "handles": node_handles([con_node, record["object"]] + record["targets"])
+        })
+    return result
+
+
+# Scene Data ==================================================================
+
+def resolve_tracked(entries):
+    """
+    Find tracked constraint nodes in the scene through one selection list.
+
+    Nodes are found by UUID and fall back to their DAG path. UUIDs shared by
+    several nodes, as in a file referenced twice, are told apart by path.
+
+    :param entries: List of (UUID or None, DAG path).
+    :return: List of (UUID or None, long node name) of nodes that exist, in entry order.
+    """
+    found = {}
+    sel = om.MSelectionList()
+    for uuid in set(uuid for uuid, path in entries if uuid):
+        start = sel.length()
+        try:
+            sel.add(om.MUuid(uuid))
+        except (RuntimeError, ValueError):
+            continue
+        found[uuid] = [sel.getDagPath(i).fullPathName() for i in range(start, sel.length())]
+
+    result, seen = [], set()
+    for uuid, path in entries:
+        candidates = found.get(uuid, [])
+        if path in candidates or (not candidates and cmds.objExists(path)):
+            name = path
+        elif candidates:
+            name = candidates[0]
+        else:
+            log.debug("Tracked node not found: {} {}".format(uuid, path))
+            continue
+        if name not in seen:
+            seen.add(name)
+            result.append((uuid if candidates else None, name))
+    return result
+
+
+def track_con(con_data):
+    """
+    Add a constraint to the UI list and the scene's tracked set.
+
+    :param con_data: Dict of constraint data from get_data.
+    """
+    track_cons([con_data])
+
+
+def track_cons(data_list):
+    """
+    Add constraints to the UI list and the scene's tracked set in bulk.
+
+    Constraints that are already tracked are skipped.
+
+    :param data_list: List of dicts of constraint data from get_data.
+    :return: Number of constraints added.
+    """
+    added = []
+    for con_data in data_list:
+        if "handles" not in con_data:
+            con_data["handles"] = node_handles(
+                [con_data["con_node"], con_data["object"]] + list(con_data["target"]))
+        uuid = con_data["handles"][0][0]
+        if uuid in _Tracked:
+            log.info("Already tracked: {}".format(con_data["con_node"]))
+            continue
+        _Tracked[uuid] = con_data["con_node"].fullPath()
+        added.append(con_data)
+
+    _CMan.populate_list(added)
+    for con_data in added:
+        watch_names(con_data["handles"])
+    write_tracked()
+    return len(added)
+
+
+@QtCore.Slot(str)
+def scan_scene(namespace=""):
+    """
+    Track all supported constraints in the scene, or in a namespace and all its nested namespaces.
+
+    :param namespace: Namespace name, without trailing colon. Whole scene if empty.
+    :return: Number of constraints added.
+    """
+    con_types = ["parentConstraint", "pointConstraint", "orientConstraint", "scaleConstraint"]
+    namespace = namespace.strip(":")
+    if namespace:
+        namespace = ":" + namespace
+        if not cmds.namespace(exists=namespace):
+            log.warning("Namespace not found: {}".format(namespace))
+            return 0
+        children = cmds.namespaceInfo(
+            namespace, listOnlyNamespaces=True, recurse=True, absoluteName=True) or []
+        con_nodes = pmc.ls([ns + ":*" for ns in [namespace] + children], type=con_types)
+    else:
+        con_nodes = pmc.ls(type=con_types)
 
-    _DagList = [item.con_dag for item in _CMan.iter_list()]
+    # Skip tracked constraints before walking any connections
+    handles = node_handles(con_nodes)
+    con_nodes = [con_node for con_node, (uuid, handle) in izip(con_nodes, handles)
+                 if uuid not in _Tracked]
 
-    pickled = pickle.dumps(_DagList)
-    encoded = base64.b64encode(pickled)
-    pmc.fileInfo("CMan_data", encoded)
+    data_list = [con_data for con_data in get_data_list(con_nodes) if con_data is not None]
+    count = track_cons(data_list)
+    log.info("Scan found {} new constraints".format(count))
+    return count
+
+
+def read_tracked(arg=None):
+    """Read tracked constraints from the scene's fileInfo attribute."""
+    log.info("Reading tracked constraints...")
+
+    _CMan.clear_list()
+    _Tracked.clear()
+    clear_names()
+    info = cmds.fileInfo(DATA_KEY, q=True) or [""]
+    global _TrackedData
+    _TrackedData = info[0]
+
+    uuids, con_nodes = [], []
+    for uuid, name in resolve_tracked(decode_tracked(_TrackedData)):
+        con_node = pmc.PyNode(name)
+        if isinstance(con_node, CON_TYPES):
+            uuids.append(uuid or cmds.ls(name, uuid=True)[0])
+            con_nodes.append(con_node)
+        else:
+            log.debug("Not a supported constraint: {}".format(name))
+
+    entries = []
+    for con_node, con_data, uuid in izip(con_nodes, get_data_list(con_nodes), uuids):
+        if con_data is None:
+            log.debug("Constraint drives nothing: {}".format(con_node))
+            continue
+        _Tracked[uuid] = con_node.fullPath()
+        entries.append(con_data)
+    _CMan.populate_list(entries)
+    for con_data in entries:
+        watch_names(con_data["handles"])
+    log.info("Read {} tracked constraints".format(len(_Tracked)))
+
+
+def refresh_tracked(entries):
+    """
+    Update the stored DAG paths of tracked list entries after renames and reparents.
+
+    :param entries: ConEntry list.
+    """
+    for entry in entries:
+        if entry.uuid in _Tracked and entry.exists:
+            _Tracked[entry.uuid] = entry.con_dag
+
+
+@QtCore.Slot()
+def write_tracked(arg=None):
+    """Write tracked constraints into the scene's fileInfo attribute if they changed."""
+    global _TrackedData
+    refresh_tracked(_CMan.iter_list())
+    data = encode_tracked(_Tracked)
+    if data == _TrackedData:
+        return
+    log.info("Writing tracked constraints...")
+    cmds.fileInfo(DATA_KEY, data)
     cmds.file(modified=True)
+    _TrackedData = data
+
 
-    log.info("Pickle written")
+@QtCore.Slot(list, list)
+def update_stale(removed, restored):
+    """
+    Untrack list entries whose nodes were deleted, and track restored ones again.
+
+    :param removed: ConEntry list of entries moved out of the list.
+    :param restored: ConEntry list of entries moved back in. Their records are rebuilt on use.
+    """
+    for entry in removed:
+        drop_record(entry.con_node, entry.handle)
+        _Tracked.pop(entry.uuid, None)
+    for entry in restored:
+        _Tracked[entry.uuid] = entry.con_dag
+    write_tracked()
+
+
+def clear_tracked(arg=None):
+    """Forget tracked constraints before another scene is loaded."""
+    global _TrackedData
+    _Tracked.clear()
+    _TrackedData = ""
+    del _PendingNodes[:]
+    del _RenamedNodes[:]
+    _Suspended.clear()
+    clear_names()
 
 
 def purge_data(arg=None):
     """Purge all data. Tag scene as modified."""
     log.debug("Purging global data...")
-    pmc.fileInfo("CMan_data", "")
+    cmds.fileInfo(DATA_KEY, "")
+    clear_tracked()
     _CMan.clear_list()
     cmds.file(modified=True)
     log.warning("Purge complete")
@@ -655,22 +1159,106 @@ def purge_data(arg=None):
 # Connection and Callback Registration ========================================
 
 
-def rename_cb(clientData=None):
-    """Callback to force resorting of the UI list on object rename."""
-    _CMan.RenameSig.emit()
-    _CMan.ObjList.sortItems(order=QtCore.Qt.AscendingOrder)
+def watch_names(handles):
+    """
+    Register name change callbacks on nodes of list entries, once per node.
+
+    :param handles: List of (UUID string, MObjectHandle), see node_handles.
+    """
+    for uuid, handle in handles:
+        key = handle.hashCode()
+        if key not in _NameWatch and handle.isValid():
+            _NameWatch[key] = om.MNodeMessage.addNameChangedCallback(handle.object(), rename_cb)
+
+
+def clear_names(arg=None):
+    """Remove all name change callbacks."""
+    if _NameWatch:
+        om.MMessage.removeCallbacks(list(_NameWatch.values()))
+    _NameWatch.clear()
+
+
+def rename_cb(mobj, prev_name, clientData=None):
+    """
+    Callback to queue a renamed node of a list entry. The queue is handled once per event loop cycle.
+
+    :param mobj: Maya MObject of the renamed node.
+    :param prev_name: Previous name of the node.
+    """
+    if _Suspended:
+        return
+    if not _RenamedNodes:
+        QtCore.QTimer.singleShot(0, flush_names)
+    _RenamedNodes.append((om.MFnDependencyNode(mobj).uuid().asString(), om.MObjectHandle(mobj)))
+
+
+def flush_names():
+    """Relabel list entries of all queued renamed nodes at once. The list re-sorts itself."""
+    nodes = list(_RenamedNodes)
+    del _RenamedNodes[:]
+    if nodes:
+        refresh_tracked(_CMan.indexed_entries(nodes))
+        _CMan.RenameSig.emit(nodes)
 
 
 def obj_add_remove_cb(mobj, clientData=None):
     """
     Callback to check stale data.
 
+    Only nodes of list entries are queued, and the queue is handled once
+    per event loop cycle. Nothing is queued while a file is read.
+
     :param mobj: Maya MObject passed from the callback.
-    :param clientData: Data parcel to pass to the callback function, passed to conditional in stale data iterator.
+    :param clientData: True when the node was added, False when removed.
+    """
+    if _Suspended:
+        return
+    uuid = om.MFnDependencyNode(mobj).uuid().asString()
+    if not _CMan.is_indexed(uuid):
+        return
+    if not _PendingNodes:
+        QtCore.QTimer.singleShot(0, flush_nodes)
+    _PendingNodes.append((uuid, om.MObjectHandle(mobj)))
+
+
+def flush_nodes():
+    """Update stale list entries for all queued nodes at once."""
+    nodes = list(_PendingNodes)
+    del _PendingNodes[:]
+    if nodes:
+        _CMan.ExistSig.emit(nodes)
+
+
+def suspend_cb(clientData=None):
+    """
+    Callback to stop tracking added and removed nodes while a file is read.
+
+    :param clientData: Name of the file operation.
+    """
+    _Suspended.add(clientData)
+
+
+def resume_cb(clientData=None):
+    """
+    Callback to resume tracking once a file is read, and check all entries once.
+
+    :param clientData: Name of the file operation.
+    """
+    _Suspended.discard(clientData)
+    if not _Suspended:
+        _CMan.ExistSig.emit(None)
+
+
+def reset_suspend_cb(clientData=None):
+    """
+    Callback to resume tracking after any change of the loaded files.
+
+    A file operation that fails or is cancelled sends no after message,
+    which would otherwise leave tracking off.
     """
-    mFnHandle = om.MFnDagNode(mobj)
-    object_dag = mFnHandle.fullPathName()
-    _CMan.ExistSig.emit((object_dag, clientData))
+    if _Suspended:
+        _Suspended.clear()
+        _CMan.ExistSig.emit(None)
 
 
 def register_connections():
@@ -682,25 +1270,42 @@ def register_connections():
     _CMan.AddSig.connect(add_con)
     _CMan.DelSig.connect(remove_con)
     _CMan.SelSig.connect(sel_con_node)
-    _CMan.CloseSig.connect(pickle_write)
+    _CMan.CloseSig.connect(write_tracked)
     _CMan.PurgeSig.connect(purge_data)
     _CMan.SwitchOffSig.connect(switch_off)
     _CMan.SwitchSingleSig.connect(switch_single)
     _CMan.SwitchAllSig.connect(switch_all)
+    _CMan.BakeSig.connect(bake_con)
+    _CMan.ScanSig.connect(scan_scene)
+    _CMan.StaleSig.connect(update_stale)
 
 
 def register_cb():
     """Register callbacks within Maya for data management and UI updates."""
     log.debug("Registering callbacks...")
 
-    pkl_write_cb = om.MSceneMessage.addCallback(
-        om.MSceneMessage.kBeforeSave, pickle_write)
-    pkl_read_cb = om.MSceneMessage.addCallback(
-        om.MSceneMessage.kAfterOpen, pickle_read)
+    data_write_cb = om.MSceneMessage.addCallback(
+        om.MSceneMessage.kBeforeSave, write_tracked)
+    data_read_cb = om.MSceneMessage.addCallback(
+        om.MSceneMessage.kAfterOpen, read_tracked)
+    data_clear_cb = om.MSceneMessage.addCallback(
+        om.MSceneMessage.kBeforeNew, clear_tracked)
     list_clear_cb = om.MSceneMessage.addCallback(
         om.MSceneMessage.kBeforeNew, _CMan.clear_list)
-    obj_name_change_cb = om.MEventMessage.addEventCallback(
-        "NameChanged", rename_cb)
+    record_new_cb = om.MSceneMessage.addCallback(
+        om.MSceneMessage.kBeforeNew, clear_records)
+    record_open_cb = om.MSceneMessage.addCallback(
+        om.MSceneMessage.kBeforeOpen, clear_records)
+    suspend_cbs = []
+    for before, after, operation in (
+            (om.MSceneMessage.kBeforeOpen, om.MSceneMessage.kAfterOpen, "open"),
+            (om.MSceneMessage.kBeforeImport, om.MSceneMessage.kAfterImport, "import"),
+            (om.MSceneMessage.kBeforeLoadReference, om.MSceneMessage.kAfterLoadReference, "load"),
+            (om.MSceneMessage.kBeforeCreateReference, om.MSceneMessage.kAfterCreateReference, "reference")):
+        suspend_cbs.append(om.MSceneMessage.addCallback(before, suspend_cb, operation))
+        suspend_cbs.append(om.MSceneMessage.addCallback(after, resume_cb, operation))
+    for message in (om.MSceneMessage.kAfterNew, om.MSceneMessage.kSceneUpdate):
+        suspend_cbs.append(om.MSceneMessage.addCallback(message, reset_suspend_cb))
     obj_rem_cb = om.MDGMessage.addNodeRemovedCallback(
         obj_add_remove_cb, "transform", clientData=False)
     obj_add_cb = om.MDGMessage.addNodeAddedCallback(
@@ -708,9 +1313,10 @@ def register_cb():
 
     global callback_list
     callback_list = [
-        pkl_write_cb, pkl_read_cb, list_clear_cb,
-        obj_name_change_cb, obj_rem_cb, obj_add_cb
-    ]
+        data_write_cb, data_read_cb, data_clear_cb, list_clear_cb,
+        record_new_cb, record_open_cb,
+        obj_rem_cb, obj_add_cb
+    ] + suspend_cbs
 
 
 def unregister_cb():
@@ -718,6 +1324,8 @@ def unregister_cb():
     log.debug("Unregistering callbacks...")
     om.MSceneMessage.removeCallbacks(callback_list)
     del callback_list[:]
+    clear_records()
+    clear_names()
 
 
 def show():
@@ -728,7 +1336,7 @@ def show():
         _CMan = ConManWindow(parent=get_maya_window())
         register_connections()
         register_cb()
-    pickle_read()
+    read_tracked()
     _CMan.show()
 
 
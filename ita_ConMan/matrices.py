@@ -0,0 +1,190 @@
+"""
+Matrix sampling and decomposition for baking and switching.
+
+Matrices follow Maya's row-vector convention: points are row vectors
+multiplied on the left, and translation sits in the last row. Arrays of
+matrices have shape (..., 4, 4) and are processed for all frames at once.
+"""
+
+import numpy
+import maya.cmds as cmds
+import maya.api.OpenMaya as om
+
+from utils.qtshim import logging
+
+log = logging.getLogger(__name__)
+
+# Order of Maya's rotateOrder enum
+ROTATE_ORDERS = ("xyz", "yzx", "zxy", "xzy", "yxz", "zyx")
+
+# Channels by attribute name, with their curve type and vector component
+CHANNELS = {
+    "translateX": ("translate", 0, "animCurveTL"),
+    "translateY": ("translate", 1, "animCurveTL"),
+    "translateZ": ("translate", 2, "animCurveTL"),
+    "rotateX": ("rotate", 0, "animCurveTA"),
+    "rotateY": ("rotate", 1, "animCurveTA"),
+    "rotateZ": ("rotate", 2, "animCurveTA"),
+    "scaleX": ("scale", 0, "animCurveTU"),
+    "scaleY": ("scale", 1, "animCurveTU"),
+    "scaleZ": ("scale", 2, "animCurveTU"),
+}
+
+
+# Sampling ====================================================================
+
+def sample_matrices(plugs, frames):
+    """
+    Evaluate matrix plugs at many frames, with one DG context per frame.
+
+    :param plugs: Names of matrix plugs, e.g. "pCube1.worldMatrix[0]".
+    :param frames: Frames in the current time unit.
+    :return: Numpy array of shape (len(plugs), len(frames), 4, 4).
+    """
+    sel = om.MSelectionList()
+    for plug in plugs:
+        sel.add(plug)
+    mplugs = [sel.getPlug(i) for i in range(len(plugs))]
+
+    unit = om.MTime.uiUnit()
+    result = numpy.empty((len(plugs), len(frames), 4, 4))
+    for f, frame in enumerate(frames):
+        context = om.MDGContext(om.MTime(frame, unit))
+        for p, mplug in enumerate(mplugs):
+            matrix = om.MFnMatrixData(mplug.asMObject(context)).matrix()
+            result[p, f] = numpy.array(list(matrix)).reshape(4, 4)
+    return result
+
+
+def transform_attrs(node):
+    """
+    Query the static transform attributes decompose needs.
+
+    :param node: Transform or joint name.
+    :return: Dict of decompose keyword arguments.
+    """
+    attrs = {
+        "rotate_order": cmds.getAttr(node + ".rotateOrder"),
+        "rotate_axis": cmds.getAttr(node + ".rotateAxis")[0],
+        "scale_pivot": cmds.getAttr(node + ".scalePivot")[0],
+        "scale_pivot_translate": cmds.getAttr(node + ".scalePivotTranslate")[0],
+        "rotate_pivot": cmds.getAttr(node + ".rotatePivot")[0],
+        "rotate_pivot_translate": cmds.getAttr(node + ".rotatePivotTranslate")[0],
+    }
+    if cmds.attributeQuery("jointOrient", node=node, exists=True):
+        attrs["joint_orient"] = cmds.getAttr(node + ".jointOrient")[0]
+    return attrs
+
+
+# Math ========================================================================
+
+def rotation_matrices(angles, order="xyz"):
+    """
+    Rotation matrices of Euler angles.
+
+    :param angles: Array of shape (..., 3) of X, Y, Z angles in radians.
+    :param order: Rotate order, first axis first.
+    :return: Array of shape (..., 3, 3).
+    """
+    angles = numpy.asarray(angles, dtype=float)
+    result = numpy.broadcast_to(numpy.eye(3), angles.shape[:-1] + (3, 3))
+    for axis in order:
+        i = "xyz".index(axis)
+        j, k = (i + 1) % 3, (i + 2) % 3
+        c, s = numpy.cos(angles[..., i]), numpy.sin(angles[..., i])
+        rot = numpy.zeros(angles.shape[:-1] + (3, 3))
+        rot[..., i, i] = 1.0
+        rot[..., j, j] = c
+        rot[..., j, k] = s
+        rot[..., k, j] = -s
+        rot[..., k, k] = c
+        result = numpy.matmul(result, rot)
+    return result
+
+
+def euler_angles(rotations, order="xyz"):
+    """
+    Euler angles of rotation matrices. Inverse of rotation_matrices away from gimbal lock.
+
+    :param rotations: Array of shape (..., 3, 3).
+    :param order: Rotate order, first axis first.
+    :return: Array of shape (..., 3) of X, Y, Z angles in radians.
+    """
+    c = numpy.swapaxes(rotations, -1, -2)
+    i, j, k = ("xyz".index(axis) for axis in order)
+    s = 1.0 if order in ("xyz", "yzx", "zxy") else -1.0
+
+    angles = numpy.empty(rotations.shape[:-2] + (3,))
+    angles[..., j] = numpy.arcsin(numpy.clip(-s * c[..., k, i], -1.0, 1.0))
+    angles[..., i] = numpy.arctan2(s * c[..., k, j], c[..., k, k])
+    angles[..., k] = numpy.arctan2(s * c[..., j, i], c[..., i, i])
+    return angles
+
+
+def decompose(local, rotate_order=0, rotate_axis=(0, 0, 0), joint_orient=(0, 0, 0),
+              scale_pivot=(0, 0, 0), scale_pivot_translate=(0, 0, 0),
+              rotate_pivot=(0, 0, 0), rotate_pivot_translate=(0, 0, 0)):
+    """
+    Decompose local matrices into transform channels.
+
+    Shear is assumed to be zero. Negative scale is put on X.
+
+    :param local: Array of shape (..., 4, 4) of local matrices.
+    :param rotate_order: Maya rotateOrder enum value.
+    :param rotate_axis: Rotate axis in degrees.
+    :param joint_orient: Joint orient in degrees.
+    :param scale_pivot, scale_pivot_translate, rotate_pivot, rotate_pivot_translate: Pivots.
+    :return: (translate, rotate in degrees, scale) arrays of shape (..., 3).
+    """
+    m = local[..., :3, :3]
+    scale = numpy.linalg.norm(m, axis=-1)
+    scale[..., 0] *= numpy.sign(numpy.linalg.det(m))
+    rot = m / scale[..., :, None]
+
+    # rot = RA * R * JO
+    ra = rotation_matrices(numpy.radians(rotate_axis), "xyz")
+    jo = rotation_matrices(numpy.radians(joint_orient), "xyz")
+    r = numpy.matmul(numpy.matmul(ra.T, rot), jo.T)
+    rotate = numpy.degrees(euler_angles(r, ROTATE_ORDERS[rotate_order]))
+
+    # Translation row = ((-sp * S + sp + spt - rp) * RA * R + rp + rpt) + t
+    sp, spt = numpy.asarray(scale_pivot), numpy.asarray(scale_pivot_translate)
+    rp, rpt = numpy.asarray(rotate_pivot), numpy.asarray(rotate_pivot_translate)
+    pivot = -sp * scale + sp + spt - rp
+    pivot = numpy.einsum("...i,...ij->...j", pivot, numpy.matmul(rot, jo.T)) + rp + rpt
+    translate = local[..., 3, :3] - pivot
+
+    return translate, rotate, scale
+
+
+def unwrap_degrees(angles, reference):
+    """
+    Remove 360 degree jumps between frames and start near a reference rotation.
+
+    :param angles: Array of shape (frames, 3) in degrees.
+    :param reference: X, Y, Z rotation the first frame should be closest to.
+    :return: Array of shape (frames, 3) in degrees.
+    """
+    angles = numpy.degrees(numpy.unwrap(numpy.radians(angles), axis=0))
+    turns = numpy.round((numpy.asarray(reference) - angles[0]) / 360.0)
+    return angles + turns * 360.0
+
+
+# Curves ======================================================================
+
+def write_curve(plug, frames, values, curve_type):
+    """
+    Key a channel on every frame with a single setAttr, and connect it.
+
+    :param plug: Plug name to drive.
+    :param frames: Frames in the current time unit.
+    :param values: Value for each frame.
+    :param curve_type: animCurve node type.
+    :return: Name of the new animCurve.
+    """
+    curve = cmds.createNode(curve_type, name=plug.replace(".", "_").replace("|", "_"))
+    count = len(frames)
+    flat = numpy.column_stack((frames, values)).ravel().tolist()
+    cmds.setAttr("{}.ktv[0:{}]".format(curve, count - 1), *flat, size=count)
+    cmds.connectAttr(curve + ".output", plug, force=True)
+    return curve
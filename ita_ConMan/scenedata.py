@@ -0,0 +1,62 @@
+"""
+Encoding of tracked constraints in the scene's fileInfo.
+
+Only the standard library is imported, so the format can be tested
+without Maya.
+"""
+
+import io
+import pickle
+import base64
+import logging
+
+log = logging.getLogger(__name__)
+
+# Version tag of the fileInfo format: "CMan2;<uuid>,<path>;<uuid>,<path>"
+DATA_KEY = "CMan_data"
+DATA_VERSION = "CMan2"
+
+
+class _PathUnpickler(pickle.Unpickler):
+
+    """Unpickler for legacy data that only allows plain Python types."""
+
+    def find_class(self, module, name):
+        raise pickle.UnpicklingError("Refusing to load {}.{}".format(module, name))
+
+
+def encode_tracked(tracked):
+    """
+    Encode tracked constraints for the scene's fileInfo.
+
+    :param tracked: Dict of UUID to DAG path.
+    :return: Encoded string.
+    """
+    entries = ["{},{}".format(uuid, path) for uuid, path in tracked.items()]
+    return ";".join([DATA_VERSION] + entries)
+
+
+def decode_tracked(data):
+    """
+    Decode tracked constraints from the scene's fileInfo.
+
+    Data written by earlier versions as a pickled, base64-encoded list of
+    DAG paths is read without UUIDs.
+
+    :param data: Encoded string.
+    :return: List of (UUID or None, DAG path).
+    """
+    if not data:
+        return []
+    fields = data.split(";")
+    if fields[0] == DATA_VERSION:
+        return [tuple(entry.split(",", 1)) for entry in fields[1:] if entry]
+
+    try:
+        paths = _PathUnpickler(io.BytesIO(base64.b64decode(data))).load()
+    except Exception:
+        log.warning("Unreadable {} data".format(DATA_KEY))
+        return []
+    if not isinstance(paths, list):
+        return []
+    return [(None, str(path)) for path in paths]
@@ -0,0 +1,70 @@
+"""
+Tests for ita_ConMan.scenedata.
+
+Runs without Maya. The module is imported from the package directory, the
+way ita_ConMan imports it, so the Maya-dependent package is not loaded.
+"""
+
+import base64
+import os
+import pickle
+import sys
+import unittest
+from collections import OrderedDict
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "ita_ConMan"))
+import scenedata
+
+_Loaded = []
+
+
+def _record_load(*args):
+    """Stand-in for a class a malicious pickle imports."""
+    _Loaded.append(args)
+
+
+class _Payload(object):
+
+    def __reduce__(self):
+        return (_record_load, ("payload",))
+
+
+class TestTrackedData(unittest.TestCase):
+
+    def test_round_trip(self):
+        """Encoded data decodes to the same UUIDs and paths, in order."""
+        tracked = OrderedDict([
+            ("1A2B3C4D-0000-0000-0000-000000000001", "|rig|hand_L|hand_L_parentConstraint1"),
+            ("1A2B3C4D-0000-0000-0000-000000000002", "|ns:rig|ns:foot_R|ns:foot_R_pointConstraint1"),
+        ])
+        data = scenedata.encode_tracked(tracked)
+
+        self.assertTrue(data.startswith(scenedata.DATA_VERSION + ";"))
+        self.assertEqual(scenedata.decode_tracked(data), list(tracked.items()))
+
+    def test_empty(self):
+        """Empty data and an empty tracked set decode to no entries."""
+        self.assertEqual(scenedata.decode_tracked(""), [])
+        self.assertEqual(scenedata.decode_tracked(scenedata.encode_tracked({})), [])
+
+    def test_legacy(self):
+        """Pickled lists of DAG paths from earlier versions are read without UUIDs."""
+        paths = ["|rig|hand_L|hand_L_parentConstraint1", "|rig|foot_R|foot_R_pointConstraint1"]
+        for protocol in (0, 2):
+            data = base64.b64encode(pickle.dumps(paths, protocol=protocol)).decode("ascii")
+            self.assertEqual(scenedata.decode_tracked(data), [(None, path) for path in paths])
+
+    def test_legacy_rejects_classes(self):
+        """Pickles that import anything are refused without running it."""
+        data = base64.b64encode(pickle.dumps([_Payload()], protocol=2)).decode("ascii")
+
+        self.assertEqual(scenedata.decode_tracked(data), [])
+        self.assertEqual(_Loaded, [])
+
+    def test_unreadable(self):
+        """Data that is neither format decodes to no entries."""
+        self.assertEqual(scenedata.decode_tracked("not data"), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
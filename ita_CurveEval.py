@@ -0,0 +1,440 @@
+"""
+CurveEval: Evaluate Maya animation curves with NumPy, without Maya.
+
+Keys are given as arrays of times, values, tangent types and slopes, as
+queried from an animCurve. Evaluation is vectorized over the sample times.
+Weighted tangents and pre- and post-infinity are supported.
+
+Slopes are in value units per time unit of the key times. Use
+slopes_from_angles to convert tangent angles queried with keyTangent.
+
+import ita_CurveEval
+y = ita_CurveEval.evaluate(times, values, in_slopes, out_slopes, out_types, t)
+y = ita_CurveEval.evaluate(
+    times, values, in_slopes, out_slopes, out_types, t, in_types=in_types,
+    in_weights=in_x, out_weights=out_x, pre_infinity="cycle", post_infinity="linear")
+
+Validate against Maya by exporting reference samples inside Maya, then
+checking them anywhere:
+ita_CurveEval.export_reference("pCube1_translateX", "tx.npz")
+ita_CurveEval.check_reference("tx.npz")
+
+The reference set checked by ita_CurveEval_tests is exported inside Maya with:
+ita_CurveEval.export_reference_set("<repo>/ita_CurveEval_reference")
+
+(c) Jeffrey "italic" Hoover
+italic DOT rendezvous AT gmail DOT com
+
+Licensed under the Apache 2.0 license.
+This script can be used for non-commercial
+and commercial projects free of charge.
+For more information, visit:
+https://www.apache.org/licenses/LICENSE-2.0
+"""
+
+import numpy
+
+
+# Tangent types Maya recomputes from the neighboring keys when keys change
+AUTO_TANGENTS = ("spline", "clamped", "plateau", "auto", "autoease", "automix", "autocustom")
+
+# Integer codes for tangent types. Types evaluated from their stored slope share FIXED.
+FIXED, LINEAR, FLAT, STEP, STEPNEXT = range(5)
+_CODES = {"linear": LINEAR, "flat": FLAT, "step": STEP, "stepnext": STEPNEXT}
+
+# Pre- and post-infinity types, as queried with setInfinity
+INFINITY_TYPES = ("constant", "linear", "cycle", "cycleRelative", "oscillate")
+
+# Iterations solving weighted segments for their curve parameter
+_SOLVE_ITERATIONS = 24
+
+
+def tangent_codes(types):
+    """
+    Convert tangent type names, as queried with keyTangent, to integer codes.
+
+    :param types: Tangent type names. Arrays of codes are returned unchanged.
+    :return: Numpy integer array of FIXED, LINEAR, FLAT, STEP or STEPNEXT.
+    """
+    types = numpy.asarray(types)
+    if types.dtype.kind in "iu":
+        return types
+    names, inverse = numpy.unique(types, return_inverse=True)
+    lookup = numpy.array([_CODES.get(name, FIXED) for name in names], dtype=int)
+    return lookup[inverse].reshape(types.shape)
+
+
+def slopes_from_angles(angles, fps):
+    """
+    Convert keyTangent angles to slopes per frame.
+
+    Maya measures tangent angles in degrees against time in seconds.
+
+    :param angles: Tangent angles in degrees.
+    :param fps: Frames per second of the scene's time unit.
+    :return: Numpy array of slopes in value units per frame.
+    """
+    return numpy.tan(numpy.radians(numpy.asarray(angles, dtype=float))) / fps
+
+
+def resolve_slopes(t0, v0, t1, v1, out_types, in_types, out_slopes, in_slopes):
+    """
+    Slopes of segments between pairs of keys, given their tangent types.
+
+    Linear and flat tangents depend only on the keys themselves, so they are
+    resolved here. This matters when a segment bridges over removed keys.
+
+    :param t0, v0: Start key times and values of each segment.
+    :param t1, v1: End key times and values of each segment.
+    :param out_types: Out tangent type or code of each start key.
+    :param in_types: In tangent type or code of each end key.
+    :param out_slopes: Stored out slope of each start key.
+    :param in_slopes: Stored in slope of each end key.
+    :return: (start slopes, end slopes) Numpy arrays.
+    """
+    out_types = tangent_codes(out_types)
+    in_types = tangent_codes(in_types)
+    line = (numpy.asarray(v1, dtype=float) - v0) / (numpy.asarray(t1, dtype=float) - t0)
+
+    m0 = numpy.where(out_types == LINEAR, line, out_slopes)
+    m0 = numpy.where(out_types == FLAT, 0.0, m0)
+    m1 = numpy.where(in_types == LINEAR, line, in_slopes)
+    m1 = numpy.where(in_types == FLAT, 0.0, m1)
+    return m0, m1
+
+
+def handle_fractions(h, w0, w1):
+    """
+    Bezier handle lengths of weighted segments, as fractions of the segment.
+
+    Handles reach a third of their tangent's x length. They are clipped to
+    the segment, and shortened together where time would run backwards.
+
+    :param h: Segment lengths in time.
+    :param w0: Out tangent x length of each start key, in time units.
+    :param w1: In tangent x length of each end key, in time units.
+    :return: (start, end) Numpy arrays of handle fractions.
+    """
+    h = numpy.asarray(h, dtype=float)
+    a = numpy.clip(numpy.asarray(w0, dtype=float) / (3.0 * h), 0.0, 1.0)
+    b = numpy.clip(numpy.asarray(w1, dtype=float) / (3.0 * h), 0.0, 1.0)
+
+    # Time is monotonic while (1 - a - b)^2 <= a * b, or a + b <= 1
+    root = numpy.sqrt(a * b)
+    folded = (a + b > 1.0) & ((1.0 - a - b) ** 2 > a * b)
+    scale = numpy.where(folded, 1.0 / numpy.where(folded, a + b - root, 1.0), 1.0)
+    return a * scale, b * scale
+
+
+def _solve_bezier(a, b, u):
+    """Parameter s where the segment's normalized time reaches u, within [0, 1]."""
+    c1 = 3.0 * a
+    c2 = 3.0 * (1.0 - b) - 6.0 * a
+    c3 = 1.0 + 3.0 * a - 3.0 * (1.0 - b)
+
+    s = u.copy()
+    lo = numpy.zeros_like(u)
+    hi = numpy.ones_like(u)
+    for _ in range(_SOLVE_ITERATIONS):
+        f = ((c3 * s + c2) * s + c1) * s - u
+        if not f.size or numpy.abs(f).max() < 1e-14:
+            break
+        lo = numpy.where(f <= 0.0, s, lo)
+        hi = numpy.where(f >= 0.0, s, hi)
+        df = (3.0 * c3 * s + 2.0 * c2) * s + c1
+        with numpy.errstate(divide="ignore", invalid="ignore"):
+            newton = s - f / df
+        # Fall back to bisection where Newton leaves the bracket
+        s = numpy.where((newton >= lo) & (newton <= hi), newton, 0.5 * (lo + hi))
+    return s
+
+
+def evaluate_segments(t0, v0, m0, t1, v1, m1, out_types, t, w0=None, w1=None):
+    """
+    Evaluate segments, one sample per segment.
+
+    All arguments are arrays of the same length as t, describing the segment
+    each sample falls in.
+
+    :param t0, v0, m0: Start key time, value and out slope.
+    :param t1, v1, m1: End key time, value and in slope.
+    :param out_types: Out tangent type or code of the start key.
+    :param t: Sample times, within [t0, t1].
+    :param w0, w1: Out and in tangent x lengths, for weighted curves. Unweighted segments are cubic Hermite.
+    :return: Numpy array of values.
+    """
+    t0 = numpy.asarray(t0, dtype=float)
+    v0 = numpy.asarray(v0, dtype=float)
+    v1 = numpy.asarray(v1, dtype=float)
+    out_types = tangent_codes(out_types)
+
+    h = numpy.asarray(t1, dtype=float) - t0
+    s = (numpy.asarray(t, dtype=float) - t0) / h
+
+    if w0 is None:
+        s2 = s * s
+        s3 = s2 * s
+
+        # Cubic Hermite
+        y = (
+            (2 * s3 - 3 * s2 + 1) * v0 +
+            (s3 - 2 * s2 + s) * h * m0 +
+            (-2 * s3 + 3 * s2) * v1 +
+            (s3 - s2) * h * m1
+        )
+    else:
+        # Cubic Bezier in both time and value
+        a, b = handle_fractions(h, w0, w1)
+        s = _solve_bezier(a, b, numpy.clip(s, 0.0, 1.0))
+        r = 1.0 - s
+        y = (
+            r * r * r * v0 +
+            3 * r * r * s * (v0 + m0 * a * h) +
+            3 * r * s * s * (v1 - m1 * b * h) +
+            s * s * s * v1
+        )
+
+    y = numpy.where((out_types == STEP) & (s < 1.0), v0, y)
+    y = numpy.where((out_types == STEPNEXT) & (s > 0.0), v1, y)
+    return y
+
+
+def infinity_times(times, values, t, pre_infinity="constant", post_infinity="constant"):
+    """
+    Map sample times outside the keyed range into it, for cycling infinity.
+
+    :param times: Key times, ascending.
+    :param values: Key values.
+    :param t: Numpy array of sample times.
+    :param pre_infinity: Infinity type before the first key.
+    :param post_infinity: Infinity type after the last key.
+    :return: (times, value offsets) Numpy arrays. Constant and linear times are left as they are.
+    """
+    start, end = times[0], times[-1]
+    period = end - start
+    mapped = t.copy()
+    offsets = numpy.zeros(t.shape)
+
+    for mode, side in ((pre_infinity, t < start), (post_infinity, t > end)):
+        if mode not in INFINITY_TYPES:
+            raise ValueError("Unknown infinity type: {}".format(mode))
+        if mode in ("constant", "linear") or period <= 0 or not side.any():
+            continue
+        cycles = numpy.floor((t[side] - start) / period)
+        local = t[side] - start - cycles * period
+        if mode == "oscillate":
+            local = numpy.where(cycles % 2 != 0, period - local, local)
+        elif mode == "cycleRelative":
+            offsets[side] = cycles * (values[-1] - values[0])
+        mapped[side] = start + local
+
+    return mapped, offsets
+
+
+def end_slopes(times, values, in_slopes, out_slopes, in_types, out_types):
+    """
+    Slopes continued by linear infinity.
+
+    :return: (in slope of the first key, out slope of the last key)
+    """
+    first, last = 0.0, 0.0
+    if times.size > 1:
+        first = (values[1] - values[0]) / (times[1] - times[0])
+        last = (values[-1] - values[-2]) / (times[-1] - times[-2])
+    in_type = tangent_codes(in_types)[0] if in_types is not None else FIXED
+    out_type = tangent_codes(out_types)[-1]
+
+    pre = {LINEAR: first, FLAT: 0.0}.get(in_type, in_slopes[0])
+    post = {LINEAR: last, FLAT: 0.0, STEP: 0.0, STEPNEXT: 0.0}.get(out_type, out_slopes[-1])
+    return pre, post
+
+
+def evaluate(times, values, in_slopes, out_slopes, out_types, t, in_types=None,
+             in_weights=None, out_weights=None, pre_infinity="constant", post_infinity="constant"):
+    """
+    Evaluate a curve at arbitrary times.
+
+    :param times: Key times, ascending.
+    :param values: Key values.
+    :param in_slopes: In slope of each key.
+    :param out_slopes: Out slope of each key.
+    :param out_types: Out tangent type or code of each key.
+    :param t: Sample times, an array of any shape.
+    :param in_types: In tangent type or code of each key. Only needed to resolve linear and flat tangents.
+    :param in_weights: In tangent x length of each key in time units, for weighted curves.
+    :param out_weights: Out tangent x length of each key in time units, for weighted curves.
+    :param pre_infinity: Infinity type before the first key, one of INFINITY_TYPES.
+    :param post_infinity: Infinity type after the last key, one of INFINITY_TYPES.
+    :return: Numpy array of values at t.
+    """
+    times = numpy.asarray(times, dtype=float)
+    values = numpy.asarray(values, dtype=float)
+    t = numpy.asarray(t, dtype=float)
+    out_types = tangent_codes(out_types)
+    in_slopes = numpy.asarray(in_slopes, dtype=float)
+    out_slopes = numpy.asarray(out_slopes, dtype=float)
+
+    mapped, offsets = infinity_times(times, values, t, pre_infinity, post_infinity)
+
+    if times.size == 1:
+        y = numpy.full(t.shape, values[0])
+    else:
+        seg = numpy.clip(numpy.searchsorted(times, mapped, side="right") - 1, 0, times.size - 2)
+        if in_types is None:
+            m0, m1 = out_slopes[seg], in_slopes[seg + 1]
+        else:
+            m0, m1 = resolve_slopes(
+                times[seg], values[seg], times[seg + 1], values[seg + 1],
+                out_types[seg], tangent_codes(in_types)[seg + 1],
+                out_slopes[seg], in_slopes[seg + 1])
+
+        w0 = w1 = None
+        if in_weights is not None and out_weights is not None:
+            w0 = numpy.asarray(out_weights, dtype=float)[seg]
+            w1 = numpy.asarray(in_weights, dtype=float)[seg + 1]
+
+        y = evaluate_segments(
+            times[seg], values[seg], m0,
+            times[seg + 1], values[seg + 1], m1,
+            out_types[seg], numpy.clip(mapped, times[0], times[-1]), w0, w1)
+
+        y = numpy.where(mapped < times[0], values[0], y)
+        y = numpy.where(mapped > times[-1], values[-1], y)
+
+    y = y + offsets
+
+    if "linear" in (pre_infinity, post_infinity):
+        pre, post = end_slopes(times, values, in_slopes, out_slopes, in_types, out_types)
+        if pre_infinity == "linear":
+            y = numpy.where(t < times[0], values[0] + pre * (t - times[0]), y)
+        if post_infinity == "linear":
+            y = numpy.where(t > times[-1], values[-1] + post * (t - times[-1]), y)
+    return y
+
+
+# Maya reference samples ======================================================
+
+def export_reference(curve, path, samples=1000, margin=1.0):
+    """
+    Export a curve and Maya's own samples of it, for check_reference.
+
+    Run inside Maya. Samples span the keyed range and margin times its
+    length on either side, to cover infinity.
+
+    :param curve: Name of an animCurve.
+    :param path: NPZ file to write.
+    :param samples: Number of sample times.
+    :param margin: Length of sampled infinity, relative to the keyed range.
+    """
+    import maya.cmds as cmds
+    import maya.mel as mel
+
+    fps = mel.eval("currentTimeUnitToFPS")
+    times = numpy.asarray(cmds.keyframe(curve, q=True, tc=True), dtype=float)
+    span = max(times[-1] - times[0], 1.0)
+    t = numpy.linspace(times[0] - margin * span, times[-1] + margin * span, samples)
+    weighted = bool(cmds.keyTangent(curve, q=True, wt=True)[0])
+
+    # Tangent x is queried in seconds
+    numpy.savez(
+        path,
+        times=times,
+        values=cmds.keyframe(curve, q=True, vc=True),
+        in_slopes=slopes_from_angles(cmds.keyTangent(curve, q=True, ia=True), fps),
+        out_slopes=slopes_from_angles(cmds.keyTangent(curve, q=True, oa=True), fps),
+        in_types=cmds.keyTangent(curve, q=True, itt=True),
+        out_types=cmds.keyTangent(curve, q=True, ott=True),
+        in_weights=numpy.asarray(cmds.keyTangent(curve, q=True, ix=True), dtype=float) * fps,
+        out_weights=numpy.asarray(cmds.keyTangent(curve, q=True, ox=True), dtype=float) * fps,
+        weighted=weighted,
+        pre_infinity=cmds.setInfinity(curve, q=True, pri=True)[0],
+        post_infinity=cmds.setInfinity(curve, q=True, poi=True)[0],
+        t=t,
+        reference=cmds.keyframe(curve, q=True, eval=True, time=[(ti, ti) for ti in t.tolist()]),
+    )
+
+
+# Keys of the reference set: uneven spacing, broken tangents, and weights
+# long enough for handles to be clipped and to overlap
+REFERENCE_TIMES = (0.0, 4.0, 5.0, 12.0, 20.0)
+REFERENCE_VALUES = (0.0, 3.0, -1.0, 2.0, 0.5)
+REFERENCE_IN_ANGLES = (10.0, 60.0, -30.0, 0.0, 45.0)
+REFERENCE_OUT_ANGLES = (-20.0, 60.0, 15.0, -70.0, 30.0)
+REFERENCE_WEIGHTS = (1.0, 9.0, 0.5, 12.0, 3.0)
+
+# Tangent types of the reference set, as (in types, out types)
+REFERENCE_TANGENTS = {
+    "fixed": (["fixed"] * 5, ["fixed"] * 5),
+    "linearflat": (["linear", "flat"] * 2 + ["linear"], ["flat", "linear"] * 2 + ["flat"]),
+    "step": (["fixed"] * 5, ["step"] * 5),
+    "stepnext": (["fixed"] * 5, ["stepnext"] * 5),
+}
+
+
+def export_reference_set(directory, samples=1000):
+    """
+    Export Maya's samples of curves covering every supported feature, for check_reference.
+
+    Run inside Maya. Every tangent set of REFERENCE_TANGENTS is exported
+    unweighted and weighted, and every infinity type is used before and
+    after the keys. The curves are created on temporary animCurve nodes.
+
+    :param directory: Directory to write one NPZ file per curve into.
+    :param samples: Number of sample times per curve.
+    :return: List of written paths.
+    """
+    import os
+    import maya.cmds as cmds
+
+    if not os.path.isdir(directory):
+        os.makedirs(directory)
+
+    paths = []
+    cases = [(name, weighted) for weighted in (False, True) for name in sorted(REFERENCE_TANGENTS)]
+    for i, (name, weighted) in enumerate(cases):
+        pre = INFINITY_TYPES[i % len(INFINITY_TYPES)]
+        post = INFINITY_TYPES[(i + 2) % len(INFINITY_TYPES)]
+        curve = cmds.createNode("animCurveTU")
+        try:
+            for time, value in zip(REFERENCE_TIMES, REFERENCE_VALUES):
+                cmds.setKeyframe(curve, time=time, value=value)
+            cmds.keyTangent(curve, e=True, weightedTangents=weighted)
+            cmds.keyTangent(curve, e=True, lock=False)
+            if weighted:
+                cmds.keyTangent(curve, e=True, weightLock=False)
+
+            in_types, out_types = REFERENCE_TANGENTS[name]
+            for ind in range(len(REFERENCE_TIMES)):
+                tangent = dict(
+                    index=(ind, ind), inAngle=REFERENCE_IN_ANGLES[ind], outAngle=REFERENCE_OUT_ANGLES[ind])
+                if weighted:
+                    tangent.update(inWeight=REFERENCE_WEIGHTS[ind], outWeight=REFERENCE_WEIGHTS[-1 - ind])
+                cmds.keyTangent(curve, e=True, **tangent)
+                cmds.keyTangent(curve, e=True, index=(ind, ind), itt=in_types[ind], ott=out_types[ind])
+            cmds.setInfinity(curve, pri=pre, poi=post)
+
+            path = os.path.join(directory, "{}_{}_{}_{}.npz".format(
+                name, "weighted" if weighted else "unweighted", pre, post))
+            export_reference(curve, path, samples=samples)
+            paths.append(path)
+        finally:
+            cmds.delete(curve)
+    return paths
+
+
+def check_reference(path):
+    """
+    Evaluate a curve exported with export_reference and compare to Maya's samples.
+
+    :param path: NPZ file written by export_reference.
+    :return: Largest absolute difference from Maya.
+    """
+    with numpy.load(path) as ref:
+        weighted = bool(ref["weighted"])
+        y = evaluate(
+            ref["times"], ref["values"], ref["in_slopes"], ref["out_slopes"],
+            ref["out_types"], ref["t"], in_types=ref["in_types"],
+            in_weights=ref["in_weights"] if weighted else None,
+            out_weights=ref["out_weights"] if weighted else None,
+            pre_infinity=str(ref["pre_infinity"]), post_infinity=str(ref["post_infinity"]))
+        return float(numpy.abs(y - ref["reference"]).max())
@@ -0,0 +1,125 @@
+"""
+Tests for ita_CurveEval.
+
+TestCurveEval checks against analytic references. TestMayaReference checks
+against the samples in ita_CurveEval_reference, exported from Maya with
+ita_CurveEval.export_reference_set, and is skipped until they are exported.
+"""
+
+import glob
+import os
+import shutil
+import tempfile
+import unittest
+import numpy
+import ita_CurveEval
+
+
+class TestCurveEval(unittest.TestCase):
+
+    def setUp(self):
+        rs = numpy.random.RandomState(0)
+        self.times = numpy.cumsum(rs.rand(20) * 5 + 0.5)
+        self.values = rs.randn(20)
+        self.in_slopes = rs.randn(20)
+        self.out_slopes = rs.randn(20)
+        self.types = ["fixed"] * 20
+
+    def test_unweighted_as_weighted(self):
+        """Weighted tangents a segment long match unweighted Hermite segments."""
+        h = numpy.diff(self.times)
+        t = numpy.linspace(self.times[0], self.times[-1], 10001)
+
+        hermite = ita_CurveEval.evaluate(
+            self.times, self.values, self.in_slopes, self.out_slopes, self.types, t)
+        bezier = ita_CurveEval.evaluate(
+            self.times, self.values, self.in_slopes, self.out_slopes, self.types, t,
+            in_weights=numpy.r_[h[0], h], out_weights=numpy.r_[h, h[-1]])
+
+        numpy.testing.assert_allclose(bezier, hermite, atol=1e-9)
+
+    def test_weighted_keys(self):
+        """Weighted curves pass through their keys, however long the handles."""
+        weights = numpy.full(20, 40.0)
+        y = ita_CurveEval.evaluate(
+            self.times, self.values, self.in_slopes, self.out_slopes, self.types, self.times,
+            in_weights=weights, out_weights=weights)
+
+        numpy.testing.assert_allclose(y, self.values, atol=1e-9)
+
+    def test_infinity(self):
+        """Infinity types continue a linear ramp from 0 to 1 over 10 frames."""
+        t = numpy.array([-15.0, -5.0, 5.0, 15.0, 25.0, 30.0])
+        expected = {
+            "constant": [0.0, 0.0, 0.5, 1.0, 1.0, 1.0],
+            "linear": [-1.5, -0.5, 0.5, 1.5, 2.5, 3.0],
+            "cycle": [0.5, 0.5, 0.5, 0.5, 0.5, 0.0],
+            "cycleRelative": [-1.5, -0.5, 0.5, 1.5, 2.5, 3.0],
+            "oscillate": [0.5, 0.5, 0.5, 0.5, 0.5, 1.0],
+        }
+        for mode, values in expected.items():
+            y = ita_CurveEval.evaluate(
+                [0.0, 10.0], [0.0, 1.0], [0.0, 0.0], [0.0, 0.0], ["linear"] * 2, t,
+                in_types=["linear"] * 2, pre_infinity=mode, post_infinity=mode)
+            numpy.testing.assert_allclose(y, values, atol=1e-12, err_msg=mode)
+
+    def test_sample_shape(self):
+        """Sample times of any shape evaluate to the same shape."""
+        t = numpy.linspace(0, 100, 24).reshape(2, 3, 4)
+        y = ita_CurveEval.evaluate(
+            self.times, self.values, self.in_slopes, self.out_slopes, self.types, t,
+            post_infinity="oscillate")
+        self.assertEqual(y.shape, t.shape)
+
+    def test_check_reference(self):
+        """check_reference reads files in the layout written by export_reference."""
+        tmp = tempfile.mkdtemp()
+        try:
+            path = os.path.join(tmp, "ramp.npz")
+            t = numpy.linspace(-20.0, 30.0, 101)
+            numpy.savez(
+                path,
+                times=[0.0, 10.0], values=[0.0, 2.0], in_slopes=[0.2, 0.2], out_slopes=[0.2, 0.2],
+                in_types=["linear", "linear"], out_types=["linear", "linear"],
+                in_weights=[10.0, 10.0], out_weights=[10.0, 10.0], weighted=True,
+                pre_infinity="cycleRelative", post_infinity="linear",
+                t=t, reference=0.2 * t)
+
+            self.assertLess(ita_CurveEval.check_reference(path), 1e-9)
+        finally:
+            shutil.rmtree(tmp)
+
+
+REFERENCE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "ita_CurveEval_reference")
+
+
+class TestMayaReference(unittest.TestCase):
+
+    def setUp(self):
+        self.paths = sorted(glob.glob(os.path.join(REFERENCE_DIR, "*.npz")))
+        if not self.paths:
+            self.skipTest("No Maya samples in {}, run export_reference_set in Maya".format(REFERENCE_DIR))
+
+    def test_reference(self):
+        """Every curve matches Maya's samples."""
+        for path in self.paths:
+            self.assertLess(ita_CurveEval.check_reference(path), 1e-6, msg=os.path.basename(path))
+
+    def test_coverage(self):
+        """The samples cover weighted and unweighted curves, stepped tangents and every infinity type."""
+        weighted, out_types, pre, post = set(), set(), set(), set()
+        for path in self.paths:
+            with numpy.load(path) as ref:
+                weighted.add(bool(ref["weighted"]))
+                out_types.update(str(name) for name in ref["out_types"])
+                pre.add(str(ref["pre_infinity"]))
+                post.add(str(ref["post_infinity"]))
+
+        self.assertEqual(weighted, set([False, True]))
+        self.assertTrue(set(["fixed", "linear", "flat", "step", "stepnext"]) <= out_types)
+        self.assertEqual(pre, set(ita_CurveEval.INFINITY_TYPES))
+        self.assertEqual(post, set(ita_CurveEval.INFINITY_TYPES))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -3,9 +3,14 @@ Jump between keys displayed in the graph editor.
 
 This allows jumping between keys on pinned curves or a group of curves on a selected object.
 
+Key times of the displayed curves are merged into one sorted index, built
+with a single query. Curve edits, selection changes and new scenes clear it,
+and it is rebuilt when the displayed curves change.
+
 import ita_KeyJump
 ita_KeyJump.next()
 ita_KeyJump.prev()
+ita_KeyJump.unregister_cb()
 
 (c) Jeffrey "italic" Hoover
 italic DOT rendezvous AT gmail DOT com
@@ -18,6 +23,10 @@ https://www.apache.org/licenses/LICENSE-2.0
 """
 
 
+import bisect
+
+import maya.api.OpenMaya as om
+import maya.api.OpenMayaAnim as oma
 import pymel.core as pmc
 import pymel.internal.plogging as logging
 
@@ -26,29 +35,78 @@ log = logging.getLogger(__name__)
 log.setLevel(logging.WARN)
 
 
-def get_curves(direction=None):
+# Global Data =================================================================
+
+_KeyTimes = None
+_IndexedCurves = None
+callback_list = []
+
+
+# Key index ===================================================================
+
+def get_curves():
+    # type: () -> Tuple[str]
+    """animCurve nodes displayed in the graph editor."""
     curves = pmc.animCurveEditor("graphEditor1GraphEd", q=True, curvesShown=True)
     log.debug(curves)
-    if not curves:
-        return []
-    displayed_curves = [
-        ("_".join(x.split("_")[:-1]), x.split("_")[-1])
-        for x in curves
-    ]
-    log.debug(displayed_curves)
-    keys = list(set(pmc.findKeyframe(x[0], attribute=x[1], which=direction) for x in displayed_curves))
-    keys.sort()
-    log.debug(keys)
-    return keys
+    return tuple(curves or ())
+
+
+def get_key_times():
+    # type: () -> List[float]
+    """Sorted, unique key times of the displayed curves, rebuilt when they change."""
+    global _KeyTimes, _IndexedCurves
+    if not callback_list:
+        register_cb()
+
+    curves = get_curves()
+    if _KeyTimes is None or curves != _IndexedCurves:
+        times = pmc.keyframe(curves, q=True, timeChange=True) if curves else []
+        _KeyTimes = sorted(set(times or []))
+        _IndexedCurves = curves
+        log.debug(_KeyTimes)
+    return _KeyTimes
+
+
+def invalidate(*args):
+    """Clear the key index. Takes any callback arguments."""
+    global _KeyTimes
+    _KeyTimes = None
+
+
+def register_cb():
+    """Register callbacks that clear the key index."""
+    log.debug("Registering callbacks...")
+    callback_list.extend([
+        oma.MAnimMessage.addAnimCurveEditedCallback(invalidate),
+        om.MEventMessage.addEventCallback("SelectionChanged", invalidate),
+        om.MSceneMessage.addCallback(om.MSceneMessage.kAfterNew, invalidate),
+        om.MSceneMessage.addCallback(om.MSceneMessage.kAfterOpen, invalidate),
+    ])
+
+
+def unregister_cb():
+    """Unregister callbacks for reloading KeyJump."""
+    log.debug("Unregistering callbacks...")
+    if callback_list:
+        om.MMessage.removeCallbacks(callback_list)
+    del callback_list[:]
+    invalidate()
+
 
+# Navigation ==================================================================
 
 def next():
-    keys = get_curves(direction="next")
+    """Go to the next key, wrapping around to the first."""
+    keys = get_key_times()
     if keys:
-        pmc.currentTime(keys[0])
+        index = bisect.bisect_right(keys, pmc.currentTime(q=True))
+        pmc.currentTime(keys[index] if index < len(keys) else keys[0])
 
 
 def prev():
-    keys = get_curves(direction="previous")
+    """Go to the previous key, wrapping around to the last."""
+    keys = get_key_times()
     if keys:
-        pmc.currentTime(keys[-1])
+        index = bisect.bisect_left(keys, pmc.currentTime(q=True))
+        pmc.currentTime(keys[index - 1])
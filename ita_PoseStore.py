@@ -0,0 +1,227 @@
+"""
+PoseStore: Capture, save and restore poses of whole rigs.
+
+A pose holds the values of all keyable, unlocked channels of a set of nodes.
+Channels are stored as indices into unique node and attribute names, with
+one value array, and saved as NPZ. Applying or blending a pose is a single
+undo step.
+
+import ita_PoseStore
+pose = ita_PoseStore.Pose.capture()                      # selected nodes
+pose = ita_PoseStore.Pose.capture(namespaces=["char1"])  # transforms in namespaces
+pose.save("C:/poses/idle.npz")
+
+pose = ita_PoseStore.Pose.load("C:/poses/idle.npz")
+pose.apply()
+pose.apply(weight=0.5)                                   # halfway from the current pose
+pose.print_diff()
+
+(c) Jeffrey "italic" Hoover
+italic DOT rendezvous AT gmail DOT com
+
+Licensed under the Apache 2.0 license.
+This script can be used for non-commercial
+and commercial projects free of charge.
+For more information, visit:
+https://www.apache.org/licenses/LICENSE-2.0
+"""
+
+import logging
+
+import maya.cmds as cmds
+import numpy
+
+log = logging.getLogger(__name__)
+
+# Attribute types that hold whole steps, such as visibility or space switches
+DISCRETE_TYPES = ("bool", "enum", "long", "short", "byte", "char")
+
+
+def pose_nodes(namespaces=None):
+    """
+    Nodes to capture.
+
+    :param namespaces: Namespace names, without trailing colon. Transforms in them and
+                       their nested namespaces, at any depth, are used.
+    :return: Selected nodes if no namespaces are given.
+    """
+    if not namespaces:
+        return cmds.ls(sl=True) or []
+    patterns = []
+    for ns in namespaces:
+        ns = ":" + ns.strip(":")
+        if not cmds.namespace(exists=ns):
+            continue
+        children = cmds.namespaceInfo(
+            ns, listOnlyNamespaces=True, recurse=True, absoluteName=True) or []
+        patterns.extend(child + ":*" for child in [ns] + children)
+    if not patterns:
+        return []
+    return cmds.ls(patterns, type="transform") or []
+
+
+class Pose(object):
+
+    """Values of channels across many nodes."""
+
+    def __init__(self, nodes, attrs, node_index, attr_index, values, discrete=None):
+        """
+        :param nodes: Unique node names.
+        :param attrs: Unique attribute names.
+        :param node_index: Index into nodes of each channel.
+        :param attr_index: Index into attrs of each channel.
+        :param values: Value of each channel.
+        :param discrete: True for each channel of a DISCRETE_TYPES attribute. Defaults to none.
+        """
+        self.nodes = numpy.asarray(nodes, dtype=str)
+        self.attrs = numpy.asarray(attrs, dtype=str)
+        self.node_index = numpy.asarray(node_index, dtype=numpy.int32)
+        self.attr_index = numpy.asarray(attr_index, dtype=numpy.int32)
+        self.values = numpy.asarray(values, dtype=float)
+        if discrete is None:
+            discrete = numpy.zeros(self.values.size, dtype=bool)
+        self.discrete = numpy.asarray(discrete, dtype=bool)
+
+    def __len__(self):
+        return self.values.size
+
+    @property
+    def plugs(self):
+        """Plug names of all channels."""
+        return [
+            "{}.{}".format(self.nodes[n], self.attrs[a])
+            for n, a in zip(self.node_index.tolist(), self.attr_index.tolist())
+        ]
+
+    # Capture and storage =====================================================
+
+    @classmethod
+    def capture(cls, nodes=None, namespaces=None):
+        """
+        Capture the current values of all keyable, unlocked channels.
+
+        :param nodes: Node names. Defaults to pose_nodes(namespaces).
+        :param namespaces: Namespaces to capture when no nodes are given.
+        :return: Pose.
+        """
+        if nodes is None:
+            nodes = pose_nodes(namespaces)
+
+        attr_ids = {}
+        node_index, attr_index, values, discrete = [], [], [], []
+        for n, node in enumerate(nodes):
+            for attr in cmds.listAttr(node, k=True, u=True) or []:
+                plug = "{}.{}".format(node, attr)
+                value = cmds.getAttr(plug)
+                if not isinstance(value, (int, float)):
+                    continue
+                node_index.append(n)
+                attr_index.append(attr_ids.setdefault(attr, len(attr_ids)))
+                values.append(value)
+                discrete.append(cmds.getAttr(plug, type=True) in DISCRETE_TYPES)
+
+        attrs = sorted(attr_ids, key=attr_ids.get)
+        return cls(nodes, attrs, node_index, attr_index, values, discrete)
+
+    def save(self, path):
+        """
+        Write the pose to an NPZ file.
+
+        :param path: File path.
+        """
+        numpy.savez_compressed(
+            path, nodes=self.nodes, attrs=self.attrs,
+            node_index=self.node_index, attr_index=self.attr_index, values=self.values,
+            discrete=self.discrete)
+
+    @classmethod
+    def load(cls, path):
+        """
+        Read a pose written by save.
+
+        :param path: File path.
+        :return: Pose.
+        """
+        with numpy.load(path) as data:
+            return cls(
+                data["nodes"], data["attrs"],
+                data["node_index"], data["attr_index"], data["values"],
+                data["discrete"] if "discrete" in data.files else None)
+
+    # Scene ===================================================================
+
+    def current(self):
+        """
+        Current scene values of the pose's channels.
+
+        :return: (Numpy array of values, boolean Numpy array of channels that exist)
+        """
+        values = numpy.zeros(len(self))
+        exists = numpy.zeros(len(self), dtype=bool)
+        for i, plug in enumerate(self.plugs):
+            if cmds.objExists(plug):
+                values[i] = cmds.getAttr(plug)
+                exists[i] = True
+        return values, exists
+
+    def apply(self, weight=1.0):
+        """
+        Set the scene to the pose, or blend toward it, as one undo step.
+
+        Channels that no longer exist or cannot be set are skipped. Discrete
+        channels, such as booleans and enums, switch to the pose at a weight
+        of 0.5 and above instead of blending.
+
+        :param weight: Blend from the current value (0.0) to the pose (1.0).
+        :return: Number of channels set.
+        """
+        current, exists = self.current()
+        values = current + weight * (self.values - current)
+        values[self.discrete] = self.values[self.discrete] if weight >= 0.5 else current[self.discrete]
+        changed = exists & (values != current)
+
+        count = 0
+        plugs = self.plugs
+        cmds.undoInfo(openChunk=True)
+        try:
+            for i in numpy.flatnonzero(changed).tolist():
+                try:
+                    cmds.setAttr(plugs[i], values[i])
+                    count += 1
+                except RuntimeError:
+                    log.warning("Could not set {}".format(plugs[i]))
+        finally:
+            cmds.undoInfo(closeChunk=True)
+
+        missing = len(self) - int(exists.sum())
+        if missing:
+            log.warning("Skipped {} channels that no longer exist".format(missing))
+        return count
+
+    def diff(self, tolerance=0.00001):
+        """
+        Channels whose scene value differs from the pose.
+
+        :param tolerance: Largest difference treated as equal.
+        :return: List of (plug, pose value, scene value) sorted by largest difference. Missing channels have None.
+        """
+        current, exists = self.current()
+        delta = numpy.where(exists, numpy.abs(current - self.values), numpy.inf)
+        plugs = self.plugs
+        return [
+            (plugs[i], self.values[i], current[i] if exists[i] else None)
+            for i in numpy.argsort(-delta, kind="mergesort").tolist()
+            if delta[i] > tolerance
+        ]
+
+    def print_diff(self, tolerance=0.00001):
+        """
+        Print channels whose scene value differs from the pose.
+
+        :param tolerance: Largest difference treated as equal.
+        """
+        rows = self.diff(tolerance)
+        for plug, stored, scene in rows:
+            scene = "missing" if scene is None else "{:.5g}".format(scene)
+            print("{:>12.5g} -> {:>12}  {}".format(stored, scene, plug))
+        print("{} of {} channels differ".format(len(rows), len(self)))
@@ -0,0 +1,180 @@
+"""
+ita_Progress: Throttled progress reporting and cancellation for long-running tools.
+
+Steps are cheap: the display is updated and cancellation is polled at most
+once per interval, and the clock is only read every few steps. Sub-tasks
+report into a share of their parent's range. Inside an interactive Maya
+session a progress window is shown; otherwise progress is logged.
+
+with Progress("Deleting redundant keys", total=len(curves)) as progress:
+    for c in curves:
+        if progress.step():
+            break
+        with progress.subtask(total=len(keys)) as sub:
+            for k in keys:
+                if sub.step():
+                    break
+
+Only the standard library is imported, so the module is safe to use from
+standalone scripts; Maya is imported when a progress window is opened.
+"""
+
+import logging
+from timeit import default_timer
+
+log = logging.getLogger(__name__)
+
+
+class _MayaWindow(object):
+
+    """Maya's progressWindow."""
+
+    def __init__(self, title, status):
+        import maya.cmds as cmds
+        self.cmds = cmds
+        cmds.progressWindow(title=title, status=status, max=100, progress=0, isInterruptable=True)
+
+    def update(self, percent, status):
+        self.cmds.progressWindow(e=True, progress=int(percent), status=status)
+
+    def cancelled(self):
+        return self.cmds.progressWindow(q=True, isCancelled=True)
+
+    def end(self):
+        self.cmds.progressWindow(endProgress=True)
+
+
+class _Log(object):
+
+    """Headless progress through logging. Cannot be cancelled by the user."""
+
+    def __init__(self, title, status):
+        self.title = title
+
+    def update(self, percent, status):
+        log.info("{}: {:.0f}% {}".format(self.title, percent, status))
+
+    def cancelled(self):
+        return False
+
+    def end(self):
+        log.info("{}: done".format(self.title))
+
+
+def _interactive_maya():
+    try:
+        import maya.cmds as cmds
+        return not cmds.about(batch=True)
+    except (ImportError, AttributeError):
+        return False
+
+
+class Progress(object):
+
+    """Progress of a task with a known number of steps."""
+
+    def __init__(self, title, total, status="", interval=0.1, every=1, headless=None, _parent=None, _span=None):
+        """
+        :param title: Task title.
+        :param total: Number of steps.
+        :param status: Status line shown with the progress.
+        :param interval: Seconds between display updates and cancellation polls.
+        :param every: Steps between clock reads.
+        :param headless: Log instead of showing a window. Defaults to True outside an interactive Maya session.
+        """
+        self.title = title
+        self.total = max(total, 1)
+        self.status = status
+        self.done = 0
+        self._parent = _parent
+        self._root = _parent._root if _parent is not None else self
+        self._base = _parent._position() if _parent is not None else 0.0
+        self._span = _span if _span is not None else 100.0
+
+        if _parent is None:
+            self.interval = interval
+            self.every = max(every, 1)
+            self.headless = not _interactive_maya() if headless is None else headless
+            self._backend = None
+            self._cancelled = False
+            self._last_time = 0.0
+            self._countdown = self.every
+
+    # Context =================================================================
+
+    def __enter__(self):
+        if self._root is self:
+            backend = _Log if self.headless else _MayaWindow
+            self._backend = backend(self.title, self.status)
+            self._last_time = default_timer()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if self._root is self:
+            self._backend.end()
+            self._backend = None
+        elif not self.cancelled:
+            # Hand the whole span back to the parent
+            self.done = self.total
+            self._root._report(self._position(), self.status)
+        return False
+
+    # Reporting ===============================================================
+
+    @property
+    def cancelled(self):
+        """The user or caller cancelled the task."""
+        return self._root._cancelled
+
+    def cancel(self):
+        """Cancel the task and all of its sub-tasks."""
+        self._root._cancelled = True
+
+    def step(self, amount=1, status=None):
+        """
+        Advance the task.
+
+        :param amount: Number of steps done.
+        :param status: New status line.
+        :return: True if the task was cancelled and should stop.
+        """
+        self.done += amount
+        if status is not None:
+            self.status = status
+        root = self._root
+        root._countdown -= 1
+        if root._countdown > 0:
+            return root._cancelled
+        root._countdown = root.every
+        return root._report(self._position(), self.status)
+
+    def subtask(self, total, steps=1, status=None):
+        """
+        Create a sub-task that fills the range of the parent's next steps.
+
+        The parent advances by steps when the sub-task's block ends.
+
+        :param total: Number of steps of the sub-task.
+        :param steps: Number of the parent's steps the sub-task covers.
+        :param status: Status line of the sub-task. Defaults to the parent's.
+        :return: Progress to use as a context manager.
+        """
+        span = self._span * float(steps) / self.total
+        sub = Progress(
+            self.title, total, status=self.status if status is None else status,
+            _parent=self, _span=span)
+        self.done += steps
+        return sub
+
+    def _position(self):
+        return self._base + self._span * min(self.done, self.total) / float(self.total)
+
+    def _report(self, percent, status):
+        now = default_timer()
+        if self._backend is None or now - self._last_time < self.interval:
+            return self._cancelled
+        self._last_time = now
+        self._backend.update(percent, status)
+        if self._backend.cancelled():
+            self._cancelled = True
+        return self._cancelled
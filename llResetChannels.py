@@ -2,6 +2,10 @@
 Original MEL script by Lluis Llobera: lluisllobera@hotmail.com
 Python version by Jeffrey "italic" Hoover: italic.rendezvous@gmail.com
 
+Default values are cached per node type and attribute, so resetting many
+controls of the same kind queries each default once. The reset is a single
+undo step.
+
 import llResetChannels
 llResetChannels.llResetChannels()
 """
@@ -9,22 +13,64 @@ llResetChannels.llResetChannels()
 import maya.cmds as cmds
 
 
+# (node type, attribute) to default value of static attributes
+_defaults = {}
+
+
+def defaultValue(obj, nodeType, chan, dynamic):
+    """
+    Default value of a channel.
+
+    :param obj: Node name.
+    :param nodeType: Node type of obj.
+    :param chan: Attribute name.
+    :param dynamic: Set of obj's dynamic attribute names; these differ per node and are not cached.
+    :return: Default value.
+    """
+    if chan in dynamic:
+        return cmds.attributeQuery(chan, n=obj, ld=True)[0]
+    key = (nodeType, chan)
+    if key not in _defaults:
+        _defaults[key] = cmds.attributeQuery(chan, n=obj, ld=True)[0]
+    return _defaults[key]
+
+
+def resetValues(objects, channels=None):
+    """
+    Find the default value of every keyable, unlocked channel.
+
+    :param objects: Node names.
+    :param channels: Short channel names to limit the reset to, as selected in the channel box.
+    :return: List of (plug, default value).
+    """
+    short = bool(channels)
+    result = []
+    for obj in objects:
+        settable = cmds.listAttr(obj, k=True, u=True, sn=short) or []
+        if channels:
+            available = set(settable)
+            settable = [chan for chan in channels if chan in available]
+        if not settable:
+            continue
+        nodeType = cmds.nodeType(obj)
+        dynamic = set(cmds.listAttr(obj, ud=True, sn=short) or [])
+        for chan in settable:
+            result.append((
+                "{}.{}".format(obj, chan), defaultValue(obj, nodeType, chan, dynamic)))
+    return result
+
+
 def llResetChannels():
-    selected = False
     selchan = cmds.channelBox(
         'mainChannelBox', q=True,
         sma=True, soa=True, ssa=True
     )
-    if selchan is not None and len(selchan) > 0:
-        selected = True
-
-    for obj in cmds.ls(sl=True):
-        if not selected:
-            selchan = cmds.listAttr(obj, k=True)
-        for chan in selchan:
-            channame = "{}.{}".format(obj, chan)
-            if cmds.objExists(channame) \
-                    and cmds.getAttr(channame, k=True) \
-                    and not cmds.getAttr(channame, l=True):
-                default = cmds.attributeQuery(chan, n=obj, ld=True)
-                cmds.setAttr(channame, default[0])
+
+    values = resetValues(cmds.ls(sl=True), selchan)
+
+    cmds.undoInfo(openChunk=True)
+    try:
+        for plug, default in values:
+            cmds.setAttr(plug, default)
+    finally:
+        cmds.undoInfo(closeChunk=True)